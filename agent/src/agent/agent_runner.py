@@ -1,7 +1,8 @@
 import logging
-import json
 from typing import Dict, List, Any, Literal, Tuple, Optional
 
+import orjson
+
 # Import the graph cache from graph module
 from src.agent.graph import get_cached_graph
 from langgraph.graph.state import CompiledStateGraph
@@ -29,12 +30,12 @@ def load_system_prompt() -> str:
     return load_prompt("main_system")
 
 
-def _format_json_response(data: Dict[str, Any]) -> str:
-    """Format a response as JSON string, ensuring content ends with newline."""
+def _format_json_response(data: Dict[str, Any]) -> bytes:
+    """Format a response as UTF-8 JSON bytes, ensuring content ends with newline."""
     if "content" in data and data["content"] and not data["content"].endswith('\n'):
         data = data.copy()  # Don't modify the original
         data["content"] += "\n"
-    return json.dumps(data)
+    return orjson.dumps(data)
 
 
 def _validate_message(member_message: str) -> None:
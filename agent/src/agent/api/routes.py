@@ -1,17 +1,26 @@
+import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
 
+import orjson
 from fastapi import APIRouter, HTTPException
 from fastapi import Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 from src.agent.agent_runner import run_new_agent, run_agent
+from src.agent.models import AssistantRequest
 from src.agent.models.tool_sync import ToolResyncRequest, ToolInventoryResponse
 from src.agent.api.tool_sync_controller import get_tool_sync_controller
 
 from http import HTTPStatus
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Stop caches and reverse proxies (nginx) from holding back streamed agent chunks
+_STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
 
 class RequestValidationError(Exception):
     """Custom exception for request validation errors."""
@@ -25,18 +34,33 @@ class RequestValidationError(Exception):
 async def _parse_request_json(request: Request) -> Dict[str, Any]:
     """Parse JSON from request with error handling."""
     try:
-        return await request.json()
+        return orjson.loads(await request.body())
     except Exception:
         raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Invalid JSON payload")
 
 
-def _extract_common_fields(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract common fields from request data."""
+async def _parse_assistant_request(request: Request) -> AssistantRequest:
+    """Decode and type-check an assistant request body in a single pass."""
+    try:
+        return AssistantRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+        if any(error["type"] == "json_invalid" for error in errors):
+            raise HTTPException(status_code=HTTPStatus.BAD_REQUEST, detail="Invalid JSON payload")
+        invalid_fields = [".".join(str(part) for part in error["loc"]) or "body" for error in errors]
+        raise HTTPException(
+            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+            detail=f"Invalid values for fields: {', '.join(invalid_fields)}"
+        )
+
+
+def _extract_common_fields(data: AssistantRequest) -> Dict[str, Any]:
+    """Extract common fields from an assistant request."""
     return {
-        "server_id": data.get("serverId"),
-        "channel_id": data.get("channelId"),
-        "member_id": data.get("memberId"),
-        "conversation_id": data.get("conversationId")
+        "server_id": data.server_id,
+        "channel_id": data.channel_id,
+        "member_id": data.member_id,
+        "conversation_id": data.conversation_id
     }
 
 
@@ -77,7 +101,7 @@ def _validate_approval_logic(approved: Optional[bool], message: Optional[str]) -
 async def _create_event_stream(agent_generator):
     """Create event stream from agent generator."""
     async for chunk in agent_generator:
-        formatted_chunk = chunk if chunk else '\n'
+        formatted_chunk = chunk if chunk else b'\n'
         yield formatted_chunk
 
 
@@ -172,12 +196,16 @@ def _validate_tool_lists(added_tools: List[str], removed_tools: List[str]) -> No
         )
 
 
+# Liveness payload never changes, so it is encoded once at import
+_HEALTH_BYTES = orjson.dumps({
+    "status": "OK",
+    "message": "Yeah yeah yeah I'm fine stop checking if I'm fine"
+})
+
+
 @router.get("/health")
 def health_check():
-    return {
-        "status": "OK",
-        "message": "Yeah yeah yeah I'm fine stop checking if I'm fine"
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @router.get("/health/detailed")
@@ -245,13 +273,13 @@ def sync_recovery_health():
 # HTTP streaming endpoint for assistant
 @router.post("/assistant")
 async def invoke_agent(request: Request):
-    data = await _parse_request_json(request)
+    data = await _parse_assistant_request(request)
 
     # Extract variables from request data
     common_fields = _extract_common_fields(data)
-    message: Optional[str] = data.get("message")
-    approved: Optional[bool] = data.get("approved")
-    tool_whitelist_update: Optional[List[str]] = data.get("toolWhitelistUpdate", [])
+    message: Optional[str] = data.message
+    approved: Optional[bool] = data.approved
+    tool_whitelist_update: Optional[List[str]] = data.tool_whitelist_update
 
     # Validate required fields (approved is None means it's a new message)
     required_fields = ["server_id", "channel_id", "member_id", "conversation_id"]
@@ -271,18 +299,18 @@ async def invoke_agent(request: Request):
         tool_whitelist_update=tool_whitelist_update
     )
 
-    return StreamingResponse(_create_event_stream(agent_generator), media_type="text/plain")
+    return StreamingResponse(_create_event_stream(agent_generator), media_type="text/plain", headers=_STREAM_HEADERS)
 
 
 # HTTP streaming endpoint for new assistant
 @router.post("/assistant/new")
 async def invoke_new_agent(request: Request):
-    data = await _parse_request_json(request)
+    data = await _parse_assistant_request(request)
 
     # Extract variables from request data
     common_fields = _extract_common_fields(data)
-    message: Optional[str] = data.get("message")
-    tool_whitelist: Optional[List[str]] = data.get("toolWhitelist", [])
+    message: Optional[str] = data.message
+    tool_whitelist: Optional[List[str]] = data.tool_whitelist
 
     # Validate required fields (message is required for new agents)
     required_fields = ["server_id", "channel_id", "member_id", "conversation_id"]
@@ -305,7 +333,7 @@ async def invoke_new_agent(request: Request):
         tool_whitelist=tool_whitelist
     )
 
-    return StreamingResponse(_create_event_stream(agent_generator), media_type="text/plain")
+    return StreamingResponse(_create_event_stream(agent_generator), media_type="text/plain", headers=_STREAM_HEADERS)
 
 
 @router.post("/tool-whitelist/update")
@@ -363,11 +391,9 @@ async def update_tool_whitelist(request: Request):
         )
 
         # Log the results
-        print(f"Tool whitelist update completed for member {member_id}: ")
-        print(f"  Successful updates: {update_result['successfulUpdates']}")
-        print(f"  Failed updates: {update_result['failedUpdates']}")
-        print(f"  Added tools: {added_tools}")
-        print(f"  Removed tools: {removed_tools}")
+        logger.debug("Tool whitelist update for member %s: %d successful, %d failed, added %s, removed %s",
+                     member_id, update_result['successfulUpdates'], update_result['failedUpdates'],
+                     added_tools, removed_tools)
 
         # Include update details in response
         response_data = {
@@ -391,7 +417,7 @@ async def update_tool_whitelist(request: Request):
         return response_data
 
     except Exception as e:
-        print(f"Error updating tool whitelist for member {member_id}: {str(e)}")
+        logger.error("Error updating tool whitelist for member %s: %s", member_id, str(e))
         raise HTTPException(
             status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
             detail=f"Failed to update tool whitelist: {str(e)}"
@@ -0,0 +1,76 @@
+"""
+Unit tests for the tool sync controller.
+"""
+
+import pytest
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, Mock
+
+from src.agent.models.tool_sync import create_resync_request
+from .tool_sync_controller import ToolSyncController
+
+
+@dataclass(slots=True)
+class FakeTool:
+    """Discovered tool stub with only the attributes the controller reads."""
+
+    name: str
+    _mcp_server_name: str = "built-in"
+
+
+@pytest.fixture
+def controller():
+    """ToolSyncController wired to mocked discovery and metrics services."""
+    controller = ToolSyncController()
+    controller.tool_discovery_service = Mock()
+    controller.tool_discovery_service.discover_tools = AsyncMock()
+    controller.metrics_service = Mock()
+    return controller
+
+
+class TestHandleResyncRequest:
+    """Test cases for resync request handling."""
+
+    async def test_handle_resync_request_creates_tool_info_correctly(self, controller):
+        """Test that each discovered tool is reported with its server."""
+        # Given
+        controller.tool_discovery_service.discover_tools.return_value = [
+            FakeTool(name="local_tool"), FakeTool(name="QuipMCPServer-weather", _mcp_server_name="QuipMCPServer")
+        ]
+
+        # When
+        response = await controller.handle_resync_request(create_resync_request("test"))
+
+        # Then
+        assert [(t.name, t.mcp_server_name) for t in response.current_tools] == [
+            ("local_tool", "built-in"), ("QuipMCPServer-weather", "QuipMCPServer")
+        ]
+        controller.metrics_service.record_resync_latency.assert_called_once()
+        assert controller.metrics_service.record_resync_latency.call_args[0][0] is True
+
+    async def test_handle_resync_request_reuses_tool_info(self, controller):
+        """Test that unchanged tools reuse their ToolInfo across requests."""
+        # Given
+        tool = FakeTool(name="local_tool")
+        controller.tool_discovery_service.discover_tools.return_value = [tool]
+
+        # When
+        first = await controller.handle_resync_request(create_resync_request("first"))
+        second = await controller.handle_resync_request(create_resync_request("second"))
+
+        # Then
+        assert first.current_tools[0] is second.current_tools[0]
+
+    async def test_handle_resync_request_prunes_removed_tools(self, controller):
+        """Test that tools missing from the latest discovery leave the cache."""
+        # Given
+        kept, removed = FakeTool(name="kept_tool"), FakeTool(name="removed_tool")
+        controller.tool_discovery_service.discover_tools.return_value = [kept, removed]
+        await controller.handle_resync_request(create_resync_request("first"))
+
+        # When
+        controller.tool_discovery_service.discover_tools.return_value = [kept]
+        await controller.handle_resync_request(create_resync_request("second"))
+
+        # Then
+        assert list(controller._tool_info_cache) == [id(kept)]
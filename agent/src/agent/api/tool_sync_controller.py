@@ -7,13 +7,14 @@ synchronization when Redis message processing fails or needs recovery.
 
 import logging
 import asyncio
+import threading
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from fastapi import HTTPException
 from http import HTTPStatus
 
-from src.agent.models.tool_sync import ToolResyncRequest, ToolInventoryResponse, create_resync_response
+from src.agent.models.tool_sync import ToolInfo, ToolResyncRequest, ToolInventoryResponse, create_resync_response
 from src.agent.tools.discovery import get_tool_discovery_service
 from src.agent.monitoring.metrics_service import get_metrics_service
 from src.config.config_loader import Config
@@ -35,6 +36,9 @@ class ToolSyncController:
         self.discovery_timeout = float(discovery_config.get("timeout", 10))
         self.retry_attempts = discovery_config.get("retry_attempts", 2)
         self.retry_delay = discovery_config.get("retry_delay", 1)
+        # ToolInfo per discovered tool object, keyed by id(); the tool is kept
+        # alongside so its id cannot be reused while the entry is cached
+        self._tool_info_cache: Dict[int, Tuple[Any, ToolInfo]] = {}
     
     async def handle_resync_request(self, request: ToolResyncRequest) -> ToolInventoryResponse:
         """
@@ -65,18 +69,14 @@ class ToolSyncController:
             current_tools = await self._discover_tools_with_timeout()
             
             # Extract tool info from BaseTool instances
-            from src.agent.models.tool_sync import ToolInfo
-            tool_infos = []
-            for tool in current_tools:
-                server_name = getattr(tool, '_mcp_server_name', 'built-in')
-                tool_infos.append(ToolInfo(name=tool.name, mcp_server_name=server_name))
+            tool_infos = self._get_tool_infos(current_tools)
             
             # Create response
             response = create_resync_response(request, tool_infos)
             
             # Record successful resync metrics
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-            self.metrics_service.record_resync_request(True, latency_ms)
+            self.metrics_service.record_resync_latency(True, latency_ms)
             
             logger.info("Tool resync request completed successfully", extra={
                 "event_type": "resync_request_completed",
@@ -92,7 +92,7 @@ class ToolSyncController:
         except asyncio.TimeoutError:
             # Record failed resync metrics
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-            self.metrics_service.record_resync_request(False, latency_ms)
+            self.metrics_service.record_resync_latency(False, latency_ms)
             
             error_msg = f"Tool discovery timed out after {self.discovery_timeout} seconds"
             logger.error("Tool resync request failed due to timeout", extra={
@@ -110,7 +110,7 @@ class ToolSyncController:
         except Exception as e:
             # Record failed resync metrics
             latency_ms = (datetime.now() - start_time).total_seconds() * 1000
-            self.metrics_service.record_resync_request(False, latency_ms)
+            self.metrics_service.record_resync_latency(False, latency_ms)
             
             error_msg = f"Tool discovery failed: {str(e)}"
             logger.error("Tool resync request failed due to discovery error", extra={
@@ -125,6 +125,30 @@ class ToolSyncController:
                 detail=error_msg
             )
     
+    def _get_tool_infos(self, tools: List[Any]) -> List[ToolInfo]:
+        """
+        Get ToolInfo models for discovered tools, reusing those of unchanged tools.
+        
+        Args:
+            tools: Discovered BaseTool instances
+            
+        Returns:
+            List of ToolInfo in discovery order
+        """
+        cache = {}
+        tool_infos = []
+        for tool in tools:
+            entry = self._tool_info_cache.get(id(tool))
+            if entry is None or entry[0] is not tool:
+                server_name = getattr(tool, '_mcp_server_name', 'built-in')
+                entry = (tool, ToolInfo(name=tool.name, mcp_server_name=server_name))
+            cache[id(tool)] = entry
+            tool_infos.append(entry[1])
+        
+        # Only keep tools from the current discovery
+        self._tool_info_cache = cache
+        return tool_infos
+    
     async def _discover_tools_with_timeout(self) -> List:
         """
         Perform tool discovery with timeout management.
@@ -169,11 +193,17 @@ class ToolSyncController:
 
 # Global controller instance
 _tool_sync_controller = None
+_singleton_lock = threading.Lock()
 
 
 def get_tool_sync_controller() -> ToolSyncController:
     """Get the global tool sync controller instance."""
     global _tool_sync_controller
-    if _tool_sync_controller is None:
-        _tool_sync_controller = ToolSyncController()
-    return _tool_sync_controller
\ No newline at end of file
+    controller = _tool_sync_controller
+    if controller is None:
+        # Double-checked so concurrent first calls build exactly one instance
+        with _singleton_lock:
+            controller = _tool_sync_controller
+            if controller is None:
+                controller = _tool_sync_controller = ToolSyncController()
+    return controller
\ No newline at end of file
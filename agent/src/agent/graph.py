@@ -1,4 +1,3 @@
-import os
 import hashlib
 import logging
 import time
@@ -7,18 +6,15 @@ from langgraph.config import get_stream_writer
 from langgraph.constants import END
 from langgraph.graph.state import CompiledStateGraph
 from src.config import Config
-from src.agent.tools import get_all_tools
 from src.agent.utils.prompt_loader import load_prompt
-from langchain_mcp_adapters.client import MultiServerMCPClient
 from langgraph.types import interrupt, Command
 from langchain_core.messages import ToolMessage
-from langchain_core.tools.base import BaseTool
-from typing_extensions import TypedDict, NotRequired
+from typing_extensions import TypedDict
 from langgraph.checkpoint.memory import InMemorySaver
 from langgraph.graph import StateGraph
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode
-from typing import Annotated, Literal, Set, List
+from typing import Annotated, Literal, Optional, Set, List
 
 # Import tool discovery and publisher services
 from src.agent.tools.discovery import get_tool_discovery_service
@@ -29,6 +25,16 @@ from src.agent.monitoring.metrics_service import get_metrics_service
 logger = logging.getLogger(__name__)
 
 
+def _create_llm() -> ChatOpenAI:
+    """Create the chat model from the OpenAI configuration."""
+    openai_config = Config.get_openai_config()
+    return ChatOpenAI(
+        temperature=openai_config.get("temperature", 0),
+        model=openai_config.get("model", "gpt-4o-mini"),
+        api_key=Config.OPENAI_API_KEY
+    )
+
+
 class AgentState(TypedDict):
     messages: Annotated[list, add_messages]
     server_id: int
@@ -46,13 +52,10 @@ def route_to_human_confirmation_before_tools(
     Use in the conditional_edge to route to the ToolNode if the last message
     has tool calls. Otherwise, route to the end.
     """
-    if isinstance(state, list):
-        ai_message = state[-1]
-    elif messages := state.get("messages", []):
-        ai_message = messages[-1]
-    else:
+    messages = state if isinstance(state, list) else state.get("messages")
+    if not messages:
         raise ValueError(f"No messages found in input state to tool_edge: {state}")
-    if hasattr(ai_message, "tool_calls") and len(ai_message.tool_calls) > 0:
+    if getattr(messages[-1], "tool_calls", None):
         return "human_confirmation"
     return END
 
@@ -64,13 +67,8 @@ class Decision(TypedDict):
 
 class HumanConfirmationNode:
     """A node that asks the user to confirm the tool call."""
-    def __init__(self):
-        openai_config = Config.get_openai_config()
-        self.llm = ChatOpenAI(
-            temperature=openai_config.get("temperature", 0),
-            model=openai_config.get("model", "gpt-4o-mini"),
-            api_key=Config.OPENAI_API_KEY
-        )
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        self.llm = llm or _create_llm()
         self.system_prompt = {
             "role": "system",
             "content": load_prompt("human_confirmation")
@@ -132,19 +130,14 @@ class HumanConfirmationNode:
 class ProgressReportNode:
     """A node that reports progress to the user."""
 
-    def __init__(self):
-        openai_config = Config.get_openai_config()
-        self.llm = ChatOpenAI(
-            temperature=openai_config.get("temperature", 0),
-            model=openai_config.get("model", "gpt-4o-mini"),
-            api_key=Config.OPENAI_API_KEY
-        )
+    def __init__(self, llm: Optional[ChatOpenAI] = None):
+        self.llm = llm or _create_llm()
         self.system_prompt = {
             "role": "system",
             "content": load_prompt("progress_report")
         }
 
-    def __call__(self, state: AgentState):
+    async def __call__(self, state: AgentState):
         logger.debug("ProgressReportNode called with state type: %s", type(state))
 
         messages = state.get("messages", [])
@@ -159,21 +152,27 @@ class ProgressReportNode:
 
         logger.info("Processing %d tool calls for progress report", len(last_message.tool_calls))
 
+        prompts = []
         for tool_call in last_message.tool_calls:
             user_prompt = f"Tool name: {tool_call['name']} Tool args: {tool_call['args']}"
             logger.debug("Generating progress report for: %s", user_prompt)
 
-            messages_for_llm = [
+            prompts.append([
                 self.system_prompt,
                 {
                     "role": "user",
                     "content": user_prompt
                 }
-            ]
-            new_message = self.llm.invoke(messages_for_llm)
-            writer = get_stream_writer()
-            writer({"progress": new_message.content})
-            logger.info("Progress report generated: %s", new_message.content)
+            ])
+
+        # Generate all reports concurrently instead of one LLM round-trip per tool call
+        new_messages = await self.llm.abatch(prompts)
+        progress = "\n".join(new_message.content for new_message in new_messages)
+
+        # One stream event for the whole batch rather than one per tool call
+        writer = get_stream_writer()
+        writer({"progress": progress})
+        logger.info("Progress report generated: %s", progress)
 
         return state
 
@@ -246,19 +245,18 @@ class RejectActionNode:
         return state
 
 
+# Process-wide checkpointer so conversation memory survives graph recompilation
+_memory_saver = InMemorySaver()
+
+
 async def setup_graph(tools=None, memory_saver=None) -> CompiledStateGraph:
     if tools is None:
         tools = []
     if memory_saver is None:
-        memory_saver = InMemorySaver()
+        memory_saver = _memory_saver
 
-    os.environ["OPENAI_API_KEY"] = Config.OPENAI_API_KEY
-    openai_config = Config.get_openai_config()
-    llm = ChatOpenAI(
-        temperature=openai_config.get("temperature", 0),
-        model=openai_config.get("model", "gpt-4o-mini"),
-        api_key=Config.OPENAI_API_KEY
-    )
+    # One chat model (and HTTP connection pool) shared by every LLM-backed node
+    llm = _create_llm()
     llm_with_tools = llm.bind_tools(tools)
 
     def agent(state: AgentState):
@@ -268,9 +266,9 @@ async def setup_graph(tools=None, memory_saver=None) -> CompiledStateGraph:
     graph_builder.add_node("agent", agent)
 
     tool_node = ToolNode(tools=tools)
-    human_confirmation_node = HumanConfirmationNode()
+    human_confirmation_node = HumanConfirmationNode(llm)
     reject_action_node = RejectActionNode()
-    progress_report_node = ProgressReportNode()
+    progress_report_node = ProgressReportNode(llm)
     context_injection_node = ContextInjectionNode()
 
     graph_builder.add_node("human_confirmation", human_confirmation_node)
@@ -304,7 +302,7 @@ class GraphCache:
         self.graph = None
         self.client = None
         self.tools_hash = None
-        self.memory_saver = InMemorySaver()  # Persistent memory across recompilations
+        self.memory_saver = _memory_saver  # Persistent memory across recompilations
 
     def _compute_tools_hash(self, tools) -> str:
         """Compute a hash of the tools to detect changes."""
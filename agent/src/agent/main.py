@@ -1,24 +1,47 @@
+import asyncio
+import atexit
 import logging
 import os
-from contextlib import asynccontextmanager
+import queue
+from contextlib import asynccontextmanager, suppress
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.config import Config
 from src.agent.api.routes import router
+from src.agent.graph import get_cached_graph
+from src.agent.utils.http_client import close_client
 
 # Ensure logs directory exists
 os.makedirs('logs', exist_ok=True)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('logs/agent.log')
-    ]
-)
+# Configure logging: request handlers only enqueue records, and a background
+# listener thread does the console and file writes
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_handlers = [logging.StreamHandler(), logging.FileHandler('logs/agent.log')]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+_log_listener_stopped = False
+
+
+def _stop_log_listener():
+    """Flush queued records and stop the listener, once per process."""
+    global _log_listener_stopped
+    if not _log_listener_stopped:
+        _log_listener_stopped = True
+        _log_listener.stop()
+
+
+# The listener lives as long as the process rather than one app lifespan, so
+# records logged after shutdown (or across several lifespans) still get written
+_log_listener.start()
+atexit.register(_stop_log_listener)
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))  # Listener handlers apply the real format
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 
 # Set specific log levels for different modules
 logging.getLogger('agent.graph').setLevel(logging.INFO)
@@ -29,12 +52,28 @@ logging.getLogger('openai').setLevel(logging.WARNING)  # Reduce OpenAI client no
 logger = logging.getLogger(__name__)
 
 
+async def _prewarm_graph():
+    """Compile the graph ahead of the first request."""
+    try:
+        await get_cached_graph()
+        logger.info("Graph pre-warm completed")
+    except Exception as e:
+        logger.warning("Graph pre-warm failed, it will be compiled on first request: %s", str(e))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting application lifespan")
-    # Graph will be initialized on first request due to caching system
+    # Pre-warm the graph cache in the background so the first request skips
+    # tool discovery and graph compilation, while health probes are served
+    # right away instead of waiting on MCP servers at startup
+    prewarm_task = asyncio.create_task(_prewarm_graph())
     yield
     logger.info("Shutting down application")
+    prewarm_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await prewarm_task
+    await close_client()
 
 app = FastAPI(lifespan=lifespan)
 
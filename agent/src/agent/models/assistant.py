@@ -1,9 +1,26 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AssistantRequest(BaseModel):
-    message: str
-    memberId: int
+    """
+    Request body for the /assistant and /assistant/new streaming endpoints.
+
+    Every field is optional so the routes can still report missing fields
+    with their own messages; only wrongly typed values are rejected here.
+    """
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    message: Optional[str] = None
+    server_id: Optional[int] = Field(None, alias="serverId")
+    channel_id: Optional[int] = Field(None, alias="channelId")
+    member_id: Optional[int] = Field(None, alias="memberId")
+    conversation_id: Optional[int] = Field(None, alias="conversationId")
+    approved: Optional[bool] = None
+    tool_whitelist: Optional[List[str]] = Field(default_factory=list, alias="toolWhitelist")
+    tool_whitelist_update: Optional[List[str]] = Field(default_factory=list, alias="toolWhitelistUpdate")
 
 
 class AssistantResponse(BaseModel):
@@ -0,0 +1,48 @@
+"""
+Unit tests for assistant request models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from .assistant import AssistantRequest
+
+
+class TestAssistantRequest:
+    """Test cases for AssistantRequest model."""
+
+    def test_validate_json_reads_camel_case_fields(self):
+        """Test that a request body is decoded into snake_case fields."""
+        # Given
+        body = (
+            b'{"message": "hi", "serverId": 1, "channelId": 2, "memberId": 3,'
+            b' "conversationId": 4, "approved": false, "toolWhitelistUpdate": ["weather"]}'
+        )
+
+        # When
+        request = AssistantRequest.model_validate_json(body)
+
+        # Then
+        assert request.message == "hi"
+        assert (request.server_id, request.channel_id, request.member_id, request.conversation_id) == (1, 2, 3, 4)
+        assert request.approved is False
+        assert request.tool_whitelist_update == ["weather"]
+        assert request.tool_whitelist == []
+
+    def test_missing_fields_default_to_none(self):
+        """Test that absent fields are left for the routes to report."""
+        # When
+        request = AssistantRequest.model_validate_json(b'{}')
+
+        # Then
+        assert request.message is None
+        assert request.server_id is None
+        assert request.approved is None
+
+    def test_wrong_type_is_rejected(self):
+        """Test that a non-numeric id fails validation with its alias in the location."""
+        # When / Then
+        with pytest.raises(ValidationError) as exc_info:
+            AssistantRequest.model_validate_json(b'{"serverId": "abc"}')
+
+        assert exc_info.value.errors()[0]["loc"] == ("serverId",)
@@ -0,0 +1,33 @@
+"""
+Helpers for bucketed latency histograms.
+"""
+
+import math
+from typing import Sequence
+
+
+def bucket_percentile(buckets: Sequence[int], bounds: Sequence[float], percentile: float) -> float:
+    """
+    Get a percentile from a bucketed histogram.
+    
+    Args:
+        buckets: Count per bucket, with one more entry than bounds for the
+            overflow bucket
+        bounds: Ascending upper bound of each finite bucket
+        percentile: Percentile between 0 and 100
+        
+    Returns:
+        Upper bound of the bucket holding the percentile, 0.0 when empty
+    """
+    total = sum(buckets)
+    if total == 0:
+        return 0.0
+    # At least one sample must be reached, so low percentiles skip empty buckets
+    target = max(1, math.ceil(percentile / 100 * total))
+    cumulative = 0
+    for index, count in enumerate(buckets):
+        cumulative += count
+        if cumulative >= target:
+            break
+    # Overflow samples have no upper bound, so they report the last finite one
+    return float(bounds[min(index, len(bounds) - 1)])
@@ -7,17 +7,28 @@ for tool discovery, Redis operations, and overall system performance.
 
 import logging
 import time
+from bisect import bisect_left
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from threading import Lock
 
+from src.agent.monitoring.histogram import bucket_percentile
 from src.agent.tools.discovery import get_tool_discovery_service
 from src.agent.redis.tool_publisher import get_tool_publisher_service
 from src.agent.redis.client import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (ms) of the resync latency histogram buckets, spanning the
+# discovery timeout; a final overflow bucket counts anything slower.
+RESYNC_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+def _empty_resync_buckets() -> List[int]:
+    """Create a zeroed resync latency histogram."""
+    return [0] * (len(RESYNC_LATENCY_BUCKETS_MS) + 1)
+
 
 @dataclass
 class SystemMetrics:
@@ -53,6 +64,8 @@ class SystemMetrics:
     resync_requests_failed: int = 0
     resync_response_latency_total: float = 0.0
     resync_response_latency_count: int = 0
+    resync_success_buckets: List[int] = field(default_factory=_empty_resync_buckets)
+    resync_failure_buckets: List[int] = field(default_factory=_empty_resync_buckets)
     last_resync_request: Optional[datetime] = None
     
     def get_average_discovery_latency(self) -> float:
@@ -67,6 +80,19 @@ class SystemMetrics:
             return 0.0
         return self.resync_response_latency_total / self.resync_response_latency_count
     
+    def get_resync_percentile_latency(self, percentile: float) -> float:
+        """
+        Get a resync latency percentile across successful and failed requests.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound in milliseconds of the bucket holding the percentile
+        """
+        buckets = [s + f for s, f in zip(self.resync_success_buckets, self.resync_failure_buckets)]
+        return bucket_percentile(buckets, RESYNC_LATENCY_BUCKETS_MS, percentile)
+    
     def get_resync_success_rate(self) -> float:
         """Get resync request success rate."""
         if self.resync_requests_received == 0:
@@ -147,8 +173,9 @@ class MetricsService:
             "connection_event": event_type
         })
     
-    def record_resync_request(self, success: bool, latency_ms: float):
-        """Record resync request metrics."""
+    def record_resync_latency(self, success: bool, latency_ms: float):
+        """Record a resync request and its latency in the resync histogram."""
+        bucket = bisect_left(RESYNC_LATENCY_BUCKETS_MS, latency_ms)
         with self._lock:
             self._metrics.resync_requests_received += 1
             self._metrics.resync_response_latency_total += latency_ms
@@ -157,8 +184,10 @@ class MetricsService:
             
             if success:
                 self._metrics.resync_requests_successful += 1
+                self._metrics.resync_success_buckets[bucket] += 1
             else:
                 self._metrics.resync_requests_failed += 1
+                self._metrics.resync_failure_buckets[bucket] += 1
                 
         logger.info("Recorded resync request metrics", extra={
             "event_type": "metrics_recorded",
@@ -168,6 +197,10 @@ class MetricsService:
             "total_requests": self._metrics.resync_requests_received
         })
     
+    def record_resync_request(self, success: bool, latency_ms: float):
+        """Record resync request metrics (kept for callers of the old API)."""
+        self.record_resync_latency(success, latency_ms)
+    
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get comprehensive metrics summary."""
         with self._lock:
@@ -201,6 +234,11 @@ class MetricsService:
                     "resync_requests_successful": self._metrics.resync_requests_successful,
                     "resync_requests_failed": self._metrics.resync_requests_failed,
                     "average_resync_latency_ms": self._metrics.get_average_resync_latency(),
+                    "p50_resync_latency_ms": self._metrics.get_resync_percentile_latency(50),
+                    "p99_resync_latency_ms": self._metrics.get_resync_percentile_latency(99),
+                    "resync_latency_buckets_ms": list(RESYNC_LATENCY_BUCKETS_MS),
+                    "resync_success_buckets": list(self._metrics.resync_success_buckets),
+                    "resync_failure_buckets": list(self._metrics.resync_failure_buckets),
                     "resync_success_rate": self._metrics.get_resync_success_rate(),
                     "last_discovery_time": self._metrics.last_discovery_time.isoformat() if self._metrics.last_discovery_time else None,
                     "last_publish_time": self._metrics.last_publish_time.isoformat() if self._metrics.last_publish_time else None,
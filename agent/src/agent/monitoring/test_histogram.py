@@ -0,0 +1,32 @@
+"""
+Unit tests for the histogram helpers.
+"""
+
+from .histogram import bucket_percentile
+
+BOUNDS = (1, 10, 100)
+
+
+class TestBucketPercentile:
+    """Test cases for reading percentiles from bucketed counts."""
+
+    def test_empty_histogram(self):
+        """Test that an empty histogram reports zero."""
+        assert bucket_percentile([0, 0, 0, 0], BOUNDS, 50) == 0.0
+
+    def test_percentile_zero_skips_empty_buckets(self):
+        """Test that the minimum lands in the first non-empty bucket."""
+        # Given
+        buckets = [0, 0, 3, 0]
+
+        # When / Then
+        assert bucket_percentile(buckets, BOUNDS, 0) == 100.0
+
+    def test_median_and_tail(self):
+        """Test that the median and tail land in their buckets."""
+        # Given
+        buckets = [0, 98, 0, 2]
+
+        # When / Then
+        assert bucket_percentile(buckets, BOUNDS, 50) == 10.0
+        assert bucket_percentile(buckets, BOUNDS, 99) == 100.0
@@ -0,0 +1,49 @@
+"""
+Unit tests for the metrics service.
+"""
+
+from .metrics_service import MetricsService, RESYNC_LATENCY_BUCKETS_MS
+
+
+class TestResyncLatency:
+    """Test cases for the resync latency histogram."""
+
+    def test_record_resync_latency_success_bucket(self):
+        """Test that a successful resync increments its latency bucket."""
+        # Given
+        metrics_service = MetricsService()
+        target_idx = RESYNC_LATENCY_BUCKETS_MS.index(50)
+
+        # When
+        metrics_service.record_resync_latency(True, 42.0)
+
+        # Then
+        assert metrics_service._metrics.resync_success_buckets[target_idx] == 1
+        assert sum(metrics_service._metrics.resync_failure_buckets) == 0
+        assert metrics_service._metrics.resync_requests_successful == 1
+
+    def test_record_resync_latency_failure_overflow(self):
+        """Test that a resync slower than the last bound lands in the overflow bucket."""
+        # Given
+        metrics_service = MetricsService()
+
+        # When
+        metrics_service.record_resync_latency(False, 12_000.0)
+
+        # Then
+        assert metrics_service._metrics.resync_failure_buckets[-1] == 1
+        assert metrics_service._metrics.get_resync_percentile_latency(99) == 10000.0
+
+    def test_record_resync_request_shim(self):
+        """Test that the old API still feeds the histogram and averages."""
+        # Given
+        metrics_service = MetricsService()
+
+        # When
+        metrics_service.record_resync_request(True, 1500.0)
+        metrics_service.record_resync_request(True, 1200.0)
+
+        # Then
+        assert metrics_service._metrics.resync_success_buckets[RESYNC_LATENCY_BUCKETS_MS.index(2500)] == 2
+        assert metrics_service._metrics.get_average_resync_latency() == 1350.0
+        assert metrics_service._metrics.get_resync_percentile_latency(50) == 2500.0
@@ -0,0 +1,176 @@
+"""
+Asyncio Redis client for issuing independent commands concurrently.
+
+Unlike the synchronous RedisClient, which holds one outstanding command per
+thread, this client lets independent commands overlap on the event loop.
+Configuration, encoding, health tracking and logging come from the same
+base class as RedisClient; only the awaited I/O lives here.
+"""
+
+import asyncio
+import contextlib
+from typing import Optional, Any, Awaitable, Iterable, List
+
+import redis.asyncio as aioredis
+from redis.asyncio.retry import Retry
+from redis.exceptions import ConnectionError, RedisError
+
+from src.agent.redis.client import _RedisClientBase, connection_pool_kwargs
+
+
+class AsyncRedisClient(_RedisClientBase):
+    """Asyncio Redis client with connection management and retry logic."""
+
+    def _create_connection_pool(self) -> aioredis.ConnectionPool:
+        """Create asyncio Redis connection pool."""
+        return aioredis.ConnectionPool(
+            **connection_pool_kwargs(self._config, aioredis.UnixDomainSocketConnection, Retry)
+        )
+
+    def _create_client(self) -> aioredis.Redis:
+        """Create asyncio Redis client with connection pool."""
+        if not self._connection_pool:
+            self._connection_pool = self._create_connection_pool()
+
+        return aioredis.Redis(connection_pool=self._connection_pool)
+
+    async def connect(self) -> bool:
+        """
+        Establish connection to Redis.
+
+        The connection's retry policy backs off and retries the handshake
+        before a failure surfaces here.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        if self._is_connected and self._client:
+            if self._recently_healthy():
+                return True
+            try:
+                await self._client.ping()
+                self._mark_healthy()
+                return True
+            except RedisError:
+                self._log_connection_lost()
+
+        try:
+            self._log_connect_attempt()
+            self._client = self._create_client()
+            await self._client.ping()
+            self._connected()
+            return True
+
+        except Exception as e:
+            return self._connect_failed(e)
+
+    async def disconnect(self):
+        """Disconnect from Redis."""
+        with contextlib.suppress(Exception):
+            if self._client:
+                await self._client.aclose()
+        with contextlib.suppress(Exception):
+            if self._connection_pool:
+                await self._connection_pool.disconnect()
+
+        self._reset_state()
+
+    async def execute_with_retry(self, operation_name: str, operation_func, *args, **kwargs) -> Any:
+        """
+        Execute an async Redis operation, reconnecting first if the connection was lost.
+
+        Connection errors and timeouts are retried with backoff by the
+        connection's redis-py retry policy before they surface here.
+
+        Args:
+            operation_name: Name of the operation for logging
+            operation_func: Coroutine function performing the Redis operation
+            *args: Arguments for the operation
+            **kwargs: Keyword arguments for the operation
+
+        Returns:
+            Result of the operation or None if all retries failed
+        """
+        try:
+            if not self._is_connected or not self._client:
+                if not await self.connect():
+                    raise ConnectionError("Failed to establish Redis connection")
+
+            result = await operation_func(*args, **kwargs)
+            self._mark_healthy()
+            return result
+
+        except Exception as e:
+            return self._operation_failed(operation_name, e)
+
+    async def run_many(self, coros: Iterable[Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent Redis operations concurrently.
+
+        Args:
+            coros: Awaitables such as client.lpush(...) / client.llen(...)
+
+        Returns:
+            Results in input order; failed operations yield their exception
+        """
+        return await asyncio.gather(*coros, return_exceptions=True)
+
+    async def lpush(self, key: str, *values, compress: bool = False) -> Optional[int]:
+        """Push values to the left of a Redis list with retry logic."""
+        encoded = [self._encode(v, compress) for v in values]
+        return await self.execute_with_retry(
+            f"lpush({key})",
+            lambda: self._client.lpush(key, *encoded)
+        )
+
+    async def rpush(self, key: str, *values, compress: bool = False) -> Optional[int]:
+        """Push values to the right of a Redis list with retry logic."""
+        encoded = [self._encode(v, compress) for v in values]
+        return await self.execute_with_retry(
+            f"rpush({key})",
+            lambda: self._client.rpush(key, *encoded)
+        )
+
+    async def llen(self, key: str) -> Optional[int]:
+        """Get length of a Redis list with retry logic."""
+        return await self.execute_with_retry(
+            f"llen({key})",
+            lambda: self._client.llen(key)
+        )
+
+    async def ping(self) -> bool:
+        """Ping Redis server with retry logic."""
+        result = await self.execute_with_retry(
+            "ping",
+            lambda: self._client.ping()
+        )
+        return result is True
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.disconnect()
+
+
+# Global async Redis client instance
+_async_redis_client: Optional[AsyncRedisClient] = None
+
+
+def get_async_redis_client() -> AsyncRedisClient:
+    """Get the global async Redis client instance."""
+    global _async_redis_client
+    if _async_redis_client is None:
+        _async_redis_client = AsyncRedisClient()
+    return _async_redis_client
+
+
+async def close_async_redis_client():
+    """Close the global async Redis client instance."""
+    global _async_redis_client
+    if _async_redis_client:
+        await _async_redis_client.disconnect()
+        _async_redis_client = None
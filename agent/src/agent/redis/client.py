@@ -3,42 +3,394 @@ Redis client with connection management and retry logic for the agent.
 """
 
 import asyncio
+import contextlib
+import functools
+import json
 import logging
+import os
+import queue
+import socket
+import threading
 import time
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List, Tuple
 import redis
-from redis.exceptions import ConnectionError, TimeoutError, RedisError
+from redis.exceptions import ConnectionError, TimeoutError, RedisError, NoScriptError
+from redis.backoff import FullJitterBackoff
+from redis.retry import Retry
+from redis.utils import HIREDIS_AVAILABLE
 from src.config.config_loader import Config
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
 logger = logging.getLogger(__name__)
 
+# Probe idle connections after 60s, every 10s, and drop them after 3 missed probes
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
 
-class RedisClient:
-    """Redis client with connection management and retry logic."""
+# Seconds disconnect waits for the fire-and-forget flusher to drain
+FLUSHER_STOP_TIMEOUT = 5.0
+
+# LPUSH values onto KEYS[1] and trim it to ARGV[1] entries in one round trip.
+# ARGV[2..n] are the values; returns the list length after trimming.
+BOUNDED_LPUSH_SCRIPT = """
+redis.call('LPUSH', KEYS[1], unpack(ARGV, 2))
+redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+return redis.call('LLEN', KEYS[1])
+"""
+
+
+# Every LZ4 frame starts with this magic number, so compressed values are
+# self-identifying and plain JSON/text values need no marker byte.
+LZ4_FRAME_MAGIC = b"\x04\x22\x4d\x18"
+
+
+def encode_value(value: Any, compress_threshold: int = 0) -> bytes:
+    """
+    Encode a value for storage in Redis.
+    
+    Bytes pass through and strings are UTF-8 encoded; anything else
+    (dicts, lists, numbers) is serialized to compact JSON.
+    
+    Args:
+        value: Value to encode
+        compress_threshold: LZ4-compress encodings larger than this many
+            bytes; 0 disables compression
+            
+    Returns:
+        Encoded value
+    """
+    if isinstance(value, bytes):
+        data = value
+    elif isinstance(value, str):
+        data = value.encode()
+    elif orjson is not None:
+        data = orjson.dumps(value)
+    else:
+        data = json.dumps(value, separators=(",", ":")).encode()
+    
+    if compress_threshold and lz4 is not None and len(data) > compress_threshold:
+        return lz4.frame.compress(data)
+    return data
+
+
+def decode_value(data: bytes) -> bytes:
+    """
+    Reverse the compression applied by encode_value.
+    
+    Values must be read from a connection without decode_responses, since
+    compressed payloads are not valid UTF-8; RedisClient.lrange does this.
+    """
+    if data.startswith(LZ4_FRAME_MAGIC):
+        if lz4 is None:
+            raise RuntimeError("lz4 is required to decode compressed Redis values")
+        return lz4.frame.decompress(data)
+    return data
+
+
+def retry_policy(config: Dict[str, Any], retry_class: type = Retry) -> Retry:
+    """
+    Build the redis-py retry policy from the Redis configuration.
+    
+    Backoff uses full jitter so clients that failed together do not retry
+    in lockstep after a Redis blip.
+    
+    Args:
+        config: Redis configuration from Config.get_redis_config()
+        retry_class: Sync or asyncio Retry class
+        
+    Returns:
+        Retry allowing max_attempts tries in total
+    """
+    retry_config = config['retry']
+    backoff = FullJitterBackoff(cap=retry_config['max_delay'], base=retry_config['base_delay'])
+    return retry_class(backoff, retry_config['max_attempts'] - 1)
+
+
+def connection_pool_kwargs(config: Dict[str, Any],
+                           unix_connection_class: type = redis.UnixDomainSocketConnection,
+                           retry_class: type = Retry) -> Dict[str, Any]:
+    """
+    Build connection pool keyword arguments from the Redis configuration.
+    
+    A configured unix_socket_path takes precedence over host/port, which
+    skips the TCP stack entirely when Redis runs on the same host.
+    
+    Args:
+        config: Redis configuration from Config.get_redis_config()
+        unix_connection_class: Connection class used for Unix domain sockets
+        retry_class: Retry class matching the connection class
+        
+    Returns:
+        Keyword arguments for a (sync or asyncio) ConnectionPool
+    """
+    pool_kwargs = {
+        'db': config['db'],
+        'decode_responses': config.get('decode_responses', True),
+        'max_connections': config.get('pool_size', 50),
+        'socket_connect_timeout': config.get('connect_timeout', 5),
+        'socket_timeout': config.get('socket_timeout', 5),
+        'retry': retry_policy(config, retry_class),
+        'health_check_interval': config.get('health_check_interval', 30),
+        'protocol': config.get('protocol', 3),
+        # Sent as CLIENT SETNAME on every new connection so CLIENT LIST shows its owner
+        'client_name': f"agent-{os.getpid()}",
+    }
+    
+    if config.get('unix_socket_path'):
+        pool_kwargs['connection_class'] = unix_connection_class
+        pool_kwargs['path'] = config['unix_socket_path']
+    else:
+        # redis-py already sets TCP_NODELAY on TCP connections
+        pool_kwargs['host'] = config['host']
+        pool_kwargs['port'] = config['port']
+        if config.get('socket_keepalive', True):
+            pool_kwargs['socket_keepalive'] = True
+            pool_kwargs['socket_keepalive_options'] = _KEEPALIVE_OPTIONS
+    
+    if config['password']:
+        pool_kwargs['password'] = config['password']
+    
+    return pool_kwargs
+
+
+# Configuration keys that affect connection pool construction
+# (decode_responses is appended by RedisClient for its raw-bytes pool)
+_POOL_CONFIG_KEYS = (
+    'host', 'port', 'db', 'password', 'unix_socket_path', 'pool_size',
+    'connect_timeout', 'socket_timeout', 'socket_keepalive', 'health_check_interval', 'protocol',
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _shared_pool(pool_key: Tuple[Tuple[str, Any], ...]) -> redis.ConnectionPool:
+    """Process-wide connection pool for one Redis configuration."""
+    config = dict(pool_key)
+    config['retry'] = dict(config['retry'])
+    if not HIREDIS_AVAILABLE:
+        # redis-py picks the C reply parser automatically when hiredis is importable
+        logger.warning("hiredis is not installed, falling back to the pure-Python Redis parser")
+    return redis.ConnectionPool(**connection_pool_kwargs(config))
+
+
+class _PipelineFlusher(threading.Thread):
+    """Background thread that drains fire-and-forget commands into pipelines."""
+    
+    def __init__(self, client: "RedisClient", batch_size: int, flush_interval: float):
+        super().__init__(name="redis-pipeline-flusher", daemon=True)
+        self._client = client
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=batch_size * 4)
+        self._stop_event = threading.Event()
+    
+    def submit(self, op: str, args: tuple, kwargs: dict) -> bool:
+        """Queue a command without blocking; returns False if the buffer is full."""
+        try:
+            self._queue.put_nowait((op, args, kwargs))
+            return True
+        except queue.Full:
+            return False
+    
+    def run(self):
+        while not self._stop_event.is_set() or not self._queue.empty():
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                continue
+            
+            # Collect until the batch is full or the flush window closes
+            batch = [first]
+            deadline = time.monotonic() + self._flush_interval
+            while len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stop_event.is_set():
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            self._flush_batch(batch)
+    
+    def _flush_batch(self, batch: List[Tuple[str, tuple, dict]]) -> None:
+        try:
+            if self._client.execute_pipeline(batch) is None:
+                logger.warning("Dropped %d fire-and-forget Redis commands after retries", len(batch))
+        except Exception as e:
+            logger.warning(f"Error flushing fire-and-forget Redis commands: {e}")
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+    
+    def flush(self, timeout: float) -> bool:
+        """Wait until all submitted commands have been sent."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+    
+    def stop(self, timeout: float) -> None:
+        """
+        Drain pending commands and stop the thread.
+        
+        A flush stuck in redis-py's retry backoff cannot be interrupted, so
+        the thread (a daemon) is abandoned once the timeout expires rather
+        than holding up shutdown.
+        """
+        self._stop_event.set()
+        self.join(timeout)
+        if self.is_alive():
+            logger.warning("Pipeline flusher still busy after %.1fs, abandoning %d queued Redis commands",
+                           timeout, self._queue.qsize())
+
+
+class _RedisClientBase:
+    """
+    Connection state, encoding and logging shared by the sync and asyncio clients.
+    
+    Subclasses only supply the I/O: creating the client, pinging it and
+    calling operations, either directly or awaited.
+    """
     
     def __init__(self):
-        self._client: Optional[redis.Redis] = None
+        self._client = None
         self._config = Config.get_redis_config()
-        self._connection_pool: Optional[redis.ConnectionPool] = None
+        self._connection_pool = None
         self._is_connected = False
+        self._health_interval = self._config.get('health_check_interval', 30)
+        self._last_ok = 0.0
+        self._compress_threshold = self._config.get('compression_threshold', 0)
+    
+    def _encode(self, value: Any, compress: bool = False) -> bytes:
+        """
+        Encode a value, compressing it only when the caller opts in.
         
-    def _create_connection_pool(self) -> redis.ConnectionPool:
-        """Create Redis connection pool."""
-        pool_kwargs = {
-            'host': self._config['host'],
-            'port': self._config['port'],
-            'db': self._config['db'],
-            'decode_responses': True,
-            'socket_connect_timeout': 5,
-            'socket_timeout': 5,
-            'retry_on_timeout': True,
-            'health_check_interval': 30,
-        }
-        
-        if self._config['password']:
-            pool_kwargs['password'] = self._config['password']
+        Compression stays per call because other consumers of a key (e.g. the
+        backend reading tools:updates) expect plain JSON.
+        """
+        return encode_value(value, self._compress_threshold if compress else 0)
+    
+    def _mark_healthy(self) -> None:
+        """Record that the connection was just used successfully."""
+        self._last_ok = time.monotonic()
+    
+    def _recently_healthy(self) -> bool:
+        """Check if the connection succeeded within the health check interval."""
+        return time.monotonic() - self._last_ok < self._health_interval
+    
+    def _reset_state(self) -> None:
+        """Drop the connection handles after a disconnect."""
+        self._client = None
+        self._connection_pool = None
+        self._is_connected = False
+        self._last_ok = 0.0
+    
+    def _log_connection_lost(self) -> None:
+        """Log that an existing connection failed its ping test."""
+        # Log Redis connection status change (Requirement 4.3)
+        logger.warning("Existing Redis connection failed ping test, reconnecting", extra={
+            "event_type": "redis_connection_status",
+            "status": "connection_lost",
+            "host": self._config['host'],
+            "port": self._config['port']
+        })
+        self._is_connected = False
+    
+    def _log_connect_attempt(self) -> None:
+        """Log the start of a connection attempt."""
+        logger.info("Attempting to connect to Redis", extra={
+            "event_type": "redis_connection_attempt",
+            "max_attempts": self._config['retry']['max_attempts'],
+            "host": self._config['host'],
+            "port": self._config['port']
+        })
+    
+    def _connected(self) -> None:
+        """Mark the connection as established and log it."""
+        self._is_connected = True
+        self._mark_healthy()
+        # Log successful connection (Requirement 4.3)
+        logger.info("Successfully connected to Redis", extra={
+            "event_type": "redis_connection_status",
+            "status": "connected",
+            "host": self._config['host'],
+            "port": self._config['port']
+        })
+    
+    def _connect_failed(self, e: Exception) -> bool:
+        """Mark the connection as down and log why connecting failed."""
+        if isinstance(e, (ConnectionError, TimeoutError)):
+            logger.error("Failed to connect to Redis after all attempts", extra={
+                "event_type": "redis_connection_exhausted",
+                "max_attempts": self._config['retry']['max_attempts'],
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "host": self._config['host'],
+                "port": self._config['port']
+            })
+        else:
+            logger.error("Unexpected error connecting to Redis", extra={
+                "event_type": "redis_connection_error",
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "host": self._config['host'],
+                "port": self._config['port']
+            }, exc_info=e)
+        
+        self._is_connected = False
+        return False
+    
+    def _operation_failed(self, operation_name: str, e: Exception) -> None:
+        """Log a failed operation, marking the connection lost on connection errors."""
+        if isinstance(e, (ConnectionError, TimeoutError)):
+            max_attempts = self._config['retry']['max_attempts']
+            logger.error(f"Redis operation '{operation_name}' failed after {max_attempts} attempts: {e}")
             
-        return redis.ConnectionPool(**pool_kwargs)
+            # Mark as disconnected to force reconnection
+            self._is_connected = False
+        else:
+            logger.error(f"Unexpected error in Redis operation '{operation_name}': {e}")
+        return None
+
+
+class RedisClient(_RedisClientBase):
+    """Redis client with connection management and retry logic."""
+    
+    def __init__(self):
+        super().__init__()
+        # Non-decoding client for reading values that may be LZ4-compressed
+        self._raw_client: Optional[redis.Redis] = None
+        self._flusher: Optional[_PipelineFlusher] = None
+        self._flusher_lock = threading.Lock()
+        self._script_sources: Dict[str, str] = {"bounded_lpush": BOUNDED_LPUSH_SCRIPT}
+        self._scripts: Dict[str, str] = {}
+    
+    def _create_connection_pool(self, decode_responses: bool = True) -> redis.ConnectionPool:
+        """Get the connection pool shared by all clients with this configuration."""
+        pool_key = tuple((key, self._config.get(key)) for key in _POOL_CONFIG_KEYS)
+        retry_key = ('retry', tuple(sorted(self._config['retry'].items())))
+        return _shared_pool(pool_key + (retry_key, ('decode_responses', decode_responses)))
     
     def _create_client(self) -> redis.Redis:
         """Create Redis client with connection pool."""
@@ -47,129 +399,130 @@ class RedisClient:
         
         return redis.Redis(connection_pool=self._connection_pool)
     
+    def _get_raw_client(self) -> redis.Redis:
+        """Get the client that returns replies as bytes, creating it on first use."""
+        if self._raw_client is None:
+            self._raw_client = redis.Redis(connection_pool=self._create_connection_pool(decode_responses=False))
+        return self._raw_client
+    
     def connect(self) -> bool:
         """
-        Establish connection to Redis with retry logic.
+        Establish connection to Redis.
+        
+        The connection's retry policy backs off and retries the handshake
+        before a failure surfaces here.
         
         Returns:
             bool: True if connection successful, False otherwise
         """
         if self._is_connected and self._client:
+            if self._recently_healthy():
+                return True
             try:
                 # Test existing connection
                 self._client.ping()
+                self._mark_healthy()
                 return True
             except RedisError:
-                # Log Redis connection status change (Requirement 4.3)
-                logger.warning("Existing Redis connection failed ping test, reconnecting", extra={
-                    "event_type": "redis_connection_status",
-                    "status": "connection_lost",
-                    "host": self._config['host'],
-                    "port": self._config['port']
-                })
-                self._is_connected = False
-        
-        retry_config = self._config['retry']
-        max_attempts = retry_config['max_attempts']
-        base_delay = retry_config['base_delay']
-        max_delay = retry_config['max_delay']
-        
-        for attempt in range(max_attempts):
-            try:
-                logger.info("Attempting to connect to Redis", extra={
-                    "event_type": "redis_connection_attempt",
-                    "attempt": attempt + 1,
-                    "max_attempts": max_attempts,
-                    "host": self._config['host'],
-                    "port": self._config['port']
-                })
-                
-                self._client = self._create_client()
-                
-                # Test connection
-                self._client.ping()
-                
-                self._is_connected = True
-                
-                # Log successful connection (Requirement 4.3)
-                logger.info("Successfully connected to Redis", extra={
-                    "event_type": "redis_connection_status",
-                    "status": "connected",
-                    "attempt": attempt + 1,
-                    "host": self._config['host'],
-                    "port": self._config['port']
-                })
-                return True
-                
-            except (ConnectionError, TimeoutError) as e:
-                logger.warning("Redis connection attempt failed", extra={
-                    "event_type": "redis_connection_failure",
-                    "attempt": attempt + 1,
-                    "max_attempts": max_attempts,
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "host": self._config['host'],
-                    "port": self._config['port']
-                })
-                
-                if attempt < max_attempts - 1:
-                    # Calculate exponential backoff delay
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.info("Retrying Redis connection", extra={
-                        "event_type": "redis_retry_delay",
-                        "delay_seconds": delay,
-                        "next_attempt": attempt + 2
-                    })
-                    time.sleep(delay)
-                else:
-                    logger.error("Failed to connect to Redis after all attempts", extra={
-                        "event_type": "redis_connection_exhausted",
-                        "max_attempts": max_attempts,
-                        "host": self._config['host'],
-                        "port": self._config['port']
-                    })
-                    
-            except Exception as e:
-                logger.error("Unexpected error connecting to Redis", extra={
-                    "event_type": "redis_connection_error",
-                    "error_type": type(e).__name__,
-                    "error_message": str(e),
-                    "attempt": attempt + 1,
-                    "host": self._config['host'],
-                    "port": self._config['port']
-                }, exc_info=True)
-                break
+                self._log_connection_lost()
         
-        self._is_connected = False
-        return False
+        try:
+            self._log_connect_attempt()
+            self._client = self._create_client()
+            
+            # Test connection
+            self._client.ping()
+            
+            self._connected()
+            self._bootstrap_scripts()
+            return True
+            
+        except Exception as e:
+            return self._connect_failed(e)
     
     def disconnect(self):
         """Disconnect from Redis."""
-        if self._client:
-            try:
+        if self._flusher:
+            self._flusher.stop(timeout=FLUSHER_STOP_TIMEOUT)
+            self._flusher = None
+        
+        # Teardown is best effort; handles are dropped even if closing fails.
+        # The pool is shared with other clients, so it is left open.
+        with contextlib.suppress(Exception):
+            if self._client:
                 self._client.close()
-                logger.info("Disconnected from Redis")
-            except Exception as e:
-                logger.warning(f"Error disconnecting from Redis: {e}")
-            finally:
-                self._client = None
-                self._is_connected = False
-        
-        if self._connection_pool:
+        with contextlib.suppress(Exception):
+            if self._raw_client:
+                self._raw_client.close()
+        
+        self._raw_client = None
+        self._reset_state()
+        logger.info("Disconnected from Redis")
+    
+    def _bootstrap_scripts(self) -> None:
+        """Load every registered Lua script on a fresh connection."""
+        for name, src in self._script_sources.items():
             try:
-                self._connection_pool.disconnect()
-            except Exception as e:
-                logger.warning(f"Error disconnecting Redis connection pool: {e}")
-            finally:
-                self._connection_pool = None
+                self._scripts[name] = self._client.script_load(src)
+            except RedisError as e:
+                # run_script loads it lazily on first use instead
+                logger.warning(f"Failed to load Redis script '{name}': {e}")
+    
+    def register_script(self, name: str, src: str) -> None:
+        """
+        Register a Lua script to be run server-side via EVALSHA.
+        
+        Args:
+            name: Name used to invoke the script with run_script
+            src: Lua source of the script
+        """
+        self._script_sources[name] = src
+        self._scripts.pop(name, None)
+        if self._is_connected and self._client:
+            self._scripts[name] = self._client.script_load(src)
+    
+    def run_script(self, name: str, keys: List[str], args: List[Any]) -> Any:
+        """
+        Run a registered Lua script atomically in a single round trip.
+        
+        Args:
+            name: Name the script was registered under
+            keys: Redis keys the script touches (KEYS)
+            args: Additional script arguments (ARGV)
+            
+        Returns:
+            Script result or None if all retries failed
+        """
+        src = self._script_sources[name]
+        
+        def run():
+            sha = self._scripts.get(name)
+            if sha is None:
+                sha = self._scripts[name] = self._client.script_load(src)
+            try:
+                return self._client.evalsha(sha, len(keys), *keys, *args)
+            except NoScriptError:
+                # Script cache was flushed (e.g. server restart), reload once
+                sha = self._scripts[name] = self._client.script_load(src)
+                return self._client.evalsha(sha, len(keys), *keys, *args)
+        
+        return self.execute_with_retry(f"script({name})", run)
     
     def is_connected(self) -> bool:
-        """Check if Redis client is connected."""
+        """
+        Check if Redis client is connected.
+        
+        Skips the ping if the connection succeeded within the health check interval.
+        """
         if not self._is_connected or not self._client:
             return False
         
+        if self._recently_healthy():
+            return True
+        
         try:
             self._client.ping()
+            self._mark_healthy()
             return True
         except RedisError:
             logger.warning("Redis connection lost")
@@ -178,7 +531,10 @@ class RedisClient:
     
     def execute_with_retry(self, operation_name: str, operation_func, *args, **kwargs) -> Any:
         """
-        Execute Redis operation with retry logic.
+        Execute Redis operation, reconnecting first if the connection was lost.
+        
+        Connection errors and timeouts are retried with backoff by the
+        connection's redis-py retry policy before they surface here.
         
         Args:
             operation_name: Name of the operation for logging
@@ -189,58 +545,44 @@ class RedisClient:
         Returns:
             Result of the operation or None if all retries failed
         """
-        retry_config = self._config['retry']
-        max_attempts = retry_config['max_attempts']
-        base_delay = retry_config['base_delay']
-        max_delay = retry_config['max_delay']
-        
-        for attempt in range(max_attempts):
-            try:
-                # Ensure we're connected
-                if not self.is_connected():
-                    if not self.connect():
-                        raise ConnectionError("Failed to establish Redis connection")
-                
-                # Execute the operation
-                result = operation_func(*args, **kwargs)
-                
-                if attempt > 0:
-                    logger.info(f"Redis operation '{operation_name}' succeeded on attempt {attempt + 1}")
-                
-                return result
-                
-            except (ConnectionError, TimeoutError) as e:
-                logger.warning(f"Redis operation '{operation_name}' failed on attempt {attempt + 1}: {e}")
-                
-                # Mark as disconnected to force reconnection
-                self._is_connected = False
-                
-                if attempt < max_attempts - 1:
-                    # Calculate exponential backoff delay
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    logger.info(f"Retrying Redis operation '{operation_name}' in {delay} seconds...")
-                    time.sleep(delay)
-                else:
-                    logger.error(f"Redis operation '{operation_name}' failed after {max_attempts} attempts")
-                    
-            except Exception as e:
-                logger.error(f"Unexpected error in Redis operation '{operation_name}': {e}")
-                break
-        
-        return None
+        try:
+            # Reconnect only if a previous operation marked the connection as lost;
+            # otherwise the operation's own error is the health signal
+            if not self._is_connected or not self._client:
+                if not self.connect():
+                    raise ConnectionError("Failed to establish Redis connection")
+            
+            result = operation_func(*args, **kwargs)
+            self._mark_healthy()
+            return result
+            
+        except Exception as e:
+            return self._operation_failed(operation_name, e)
     
-    def lpush(self, key: str, *values) -> Optional[int]:
-        """Push values to the left of a Redis list with retry logic."""
+    def lpush(self, key: str, *values, compress: bool = False) -> Optional[int]:
+        """
+        Push values to the left of a Redis list with retry logic.
+        
+        With compress=True, values above compression_threshold bytes are
+        LZ4-compressed; read such keys back with lrange.
+        """
+        encoded = [self._encode(v, compress) for v in values]
         return self.execute_with_retry(
             f"lpush({key})",
-            lambda: self._client.lpush(key, *values)
+            lambda: self._client.lpush(key, *encoded)
         )
     
-    def rpush(self, key: str, *values) -> Optional[int]:
-        """Push values to the right of a Redis list with retry logic."""
+    def rpush(self, key: str, *values, compress: bool = False) -> Optional[int]:
+        """
+        Push values to the right of a Redis list with retry logic.
+        
+        With compress=True, values above compression_threshold bytes are
+        LZ4-compressed; read such keys back with lrange.
+        """
+        encoded = [self._encode(v, compress) for v in values]
         return self.execute_with_retry(
             f"rpush({key})",
-            lambda: self._client.rpush(key, *values)
+            lambda: self._client.rpush(key, *encoded)
         )
     
     def llen(self, key: str) -> Optional[int]:
@@ -250,6 +592,140 @@ class RedisClient:
             lambda: self._client.llen(key)
         )
     
+    def lrange(self, key: str, start: int = 0, end: int = -1) -> Optional[List[bytes]]:
+        """
+        Read a range of a Redis list as bytes, decompressing compressed values.
+        
+        Reads go through a non-decoding connection so LZ4 frames arrive intact.
+        
+        Args:
+            key: List key
+            start: First index to read
+            end: Last index to read (inclusive, -1 for the end of the list)
+            
+        Returns:
+            Decoded values in list order, or None if all retries failed
+        """
+        values = self.execute_with_retry(
+            f"lrange({key})",
+            lambda: self._get_raw_client().lrange(key, start, end)
+        )
+        if values is None:
+            return None
+        return [decode_value(value) for value in values]
+    
+    def bounded_lpush(self, key: str, max_len: int, *values, compress: bool = False) -> Optional[int]:
+        """
+        Push values to the left of a Redis list and cap its length atomically.
+        
+        Args:
+            key: List key
+            max_len: Maximum number of entries kept; older entries are trimmed
+            *values: Values to push
+            compress: LZ4-compress values above compression_threshold bytes
+            
+        Returns:
+            List length after trimming, or None if all retries failed
+        """
+        encoded = [self._encode(v, compress) for v in values]
+        return self.run_script("bounded_lpush", [key], [max_len, *encoded])
+    
+    def pipeline(self, transaction: bool = False) -> Optional[redis.client.Pipeline]:
+        """
+        Create a pipeline for batching commands into a single round trip.
+        
+        Args:
+            transaction: Wrap the batch in MULTI/EXEC when True
+            
+        Returns:
+            Pipeline bound to the current connection, or None if Redis is unavailable
+        """
+        if not self.is_connected() and not self.connect():
+            return None
+        return self._client.pipeline(transaction=transaction)
+    
+    def execute_pipeline(self, ops: List[Tuple[str, tuple, dict]],
+                         transaction: bool = False,
+                         raise_on_error: bool = True) -> Optional[List[Any]]:
+        """
+        Execute a batch of commands in one pipeline with retry logic.
+        
+        Args:
+            ops: List of (command_name, args, kwargs) tuples, e.g. ("rpush", (key, value), {})
+            transaction: Wrap the batch in MULTI/EXEC when True
+            raise_on_error: When False, a failing command's exception is returned
+                in its result slot instead of failing the whole batch
+            
+        Returns:
+            List of per-command results in order, or None if all retries failed
+        """
+        if not ops:
+            return []
+        
+        def run_pipeline():
+            pipe = self._client.pipeline(transaction=transaction)
+            for name, args, kwargs in ops:
+                getattr(pipe, name)(*args, **kwargs)
+            return pipe.execute(raise_on_error=raise_on_error)
+        
+        return self.execute_with_retry(f"pipeline({len(ops)} ops)", run_pipeline)
+    
+    def _get_flusher(self) -> _PipelineFlusher:
+        """Get the background flusher, starting it on first use."""
+        if self._flusher is None:
+            with self._flusher_lock:
+                if self._flusher is None:
+                    pipeline_config = self._config.get('pipeline', {})
+                    flusher = _PipelineFlusher(
+                        self,
+                        batch_size=pipeline_config.get('batch_size', 50),
+                        flush_interval=pipeline_config.get('flush_interval_ms', 50) / 1000
+                    )
+                    flusher.start()
+                    self._flusher = flusher
+        return self._flusher
+    
+    def enqueue_async(self, op: str, *args, **kwargs) -> bool:
+        """
+        Queue a command for fire-and-forget delivery in a background pipeline.
+        
+        Use only for writes whose reply the caller does not need.
+        
+        Args:
+            op: Redis command name, e.g. "lpush"
+            *args: Arguments for the command
+            **kwargs: Keyword arguments for the command
+            
+        Returns:
+            bool: True if queued, False if the buffer is full and the command was dropped
+        """
+        if self._get_flusher().submit(op, args, kwargs):
+            return True
+        logger.warning(f"Fire-and-forget buffer full, dropping Redis command '{op}'")
+        return False
+    
+    def lpush_async(self, key: str, *values, compress: bool = False) -> bool:
+        """Push values to the left of a Redis list without waiting for the reply."""
+        return self.enqueue_async("lpush", key, *(self._encode(v, compress) for v in values))
+    
+    def rpush_async(self, key: str, *values, compress: bool = False) -> bool:
+        """Push values to the right of a Redis list without waiting for the reply."""
+        return self.enqueue_async("rpush", key, *(self._encode(v, compress) for v in values))
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait for queued fire-and-forget commands to be sent.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            bool: True if the buffer drained within the timeout
+        """
+        if self._flusher is None:
+            return True
+        return self._flusher.flush(timeout)
+    
     def ping(self) -> bool:
         """Ping Redis server with retry logic."""
         result = self.execute_with_retry(
@@ -268,21 +744,19 @@ class RedisClient:
         self.disconnect()
 
 
-# Global Redis client instance
-_redis_client: Optional[RedisClient] = None
+# Global Redis client instance (lru_cache makes the fast path a single C-level lookup)
+@functools.lru_cache(maxsize=1)
+def _make_redis_client() -> RedisClient:
+    return RedisClient()
 
 
 def get_redis_client() -> RedisClient:
     """Get the global Redis client instance."""
-    global _redis_client
-    if _redis_client is None:
-        _redis_client = RedisClient()
-    return _redis_client
+    return _make_redis_client()
 
 
 def close_redis_client():
     """Close the global Redis client instance."""
-    global _redis_client
-    if _redis_client:
-        _redis_client.disconnect()
-        _redis_client = None
\ No newline at end of file
+    if _make_redis_client.cache_info().currsize:
+        _make_redis_client().disconnect()
+        _make_redis_client.cache_clear()
@@ -0,0 +1,53 @@
+"""
+Shared fixtures for the Redis client tests.
+"""
+
+import fakeredis
+import pytest
+
+from src.agent.redis.client import _shared_pool
+from src.config.config_loader import Config
+
+
+@pytest.fixture
+def redis_config():
+    """Redis configuration with short retry delays for tests."""
+    return {
+        "host": "localhost",
+        "port": 6379,
+        "db": 0,
+        "password": None,
+        "unix_socket_path": None,
+        "protocol": 3,
+        "pool_size": 50,
+        "connect_timeout": 5,
+        "socket_timeout": 5,
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+        "compression_threshold": 0,
+        "retry": {
+            "max_attempts": 3,
+            "base_delay": 0.01,
+            "max_delay": 0.1
+        },
+        "pipeline": {
+            "batch_size": 50,
+            "flush_interval_ms": 200
+        }
+    }
+
+
+@pytest.fixture(autouse=True)
+def _stub_redis_config(redis_config, monkeypatch):
+    """Serve the test Redis configuration to every client built in a test."""
+    Config.reload()
+    _shared_pool.cache_clear()
+    monkeypatch.setattr(Config, "get_redis_config", lambda: redis_config)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """In-memory Redis server standing in for real connections."""
+    server = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr("src.agent.redis.client.redis.Redis", lambda **kwargs: server)
+    return server
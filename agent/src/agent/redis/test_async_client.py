@@ -0,0 +1,116 @@
+"""
+Unit tests for the asyncio Redis client.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from redis.exceptions import ConnectionError
+
+from .async_client import AsyncRedisClient
+
+
+@pytest.fixture
+def client():
+    """AsyncRedisClient wired to a mocked connection."""
+    client = AsyncRedisClient()
+    client._client = AsyncMock()
+    client._is_connected = True
+    return client
+
+
+class TestAsyncRedisClient:
+    """Test cases for AsyncRedisClient."""
+
+    async def test_redis_operations(self, client):
+        """Test that list operations await the underlying client."""
+        # Given
+        client._client.lpush.return_value = 2
+        client._client.llen.return_value = 2
+
+        # When
+        pushed = await client.lpush("key", "value1", "value2")
+        length = await client.llen("key")
+
+        # Then
+        assert pushed == 2
+        assert length == 2
+        client._client.lpush.assert_awaited_once_with("key", b"value1", b"value2")
+
+    async def test_run_many_overlaps_operations(self, client):
+        """Test that independent operations run concurrently."""
+        # Given
+        async def slow_llen(key):
+            await asyncio.sleep(0.05)
+            return len(key)
+        client._client.llen.side_effect = slow_llen
+        loop = asyncio.get_running_loop()
+
+        # When
+        start = loop.time()
+        results = await client.run_many(client.llen(key) for key in ["a", "bb", "ccc", "dddd"])
+        elapsed = loop.time() - start
+
+        # Then
+        assert results == [1, 2, 3, 4]
+        assert elapsed < 0.15
+
+    async def test_run_many_returns_exceptions(self, client):
+        """Test that one failing operation does not cancel the others."""
+        # Given
+        async def failing():
+            raise ValueError("boom")
+
+        async def succeeding():
+            return "ok"
+
+        # When
+        results = await client.run_many([failing(), succeeding()])
+
+        # Then
+        assert isinstance(results[0], ValueError)
+        assert results[1] == "ok"
+
+    async def test_execute_with_retry_connection_recovery(self, client):
+        """Test that the call after a connection error reconnects first."""
+        # Given
+        operation = AsyncMock(side_effect=[ConnectionError("connection reset"), "value"])
+
+        # When
+        with patch.object(client, "connect", AsyncMock(return_value=True)) as mock_connect:
+            first = await client.execute_with_retry("get", operation)
+            second = await client.execute_with_retry("get", operation)
+
+        # Then
+        assert first is None
+        assert second == "value"
+        mock_connect.assert_awaited_once()
+
+    async def test_disconnect(self, client):
+        """Test that disconnect closes the client and resets state."""
+        # Given
+        mock_redis = client._client
+
+        # When
+        await client.disconnect()
+
+        # Then
+        mock_redis.aclose.assert_awaited_once()
+        assert client._client is None
+        assert client._is_connected is False
+
+    async def test_connect_failure(self, client):
+        """Test that a failed handshake leaves the client disconnected."""
+        # Given
+        client._is_connected = False
+        mock_redis = AsyncMock()
+        mock_redis.ping.side_effect = ConnectionError("connection refused")
+
+        # When
+        with patch.object(client, "_create_client", return_value=mock_redis):
+            connected = await client.connect()
+
+        # Then
+        assert connected is False
+        assert client._is_connected is False
+        mock_redis.ping.assert_awaited_once()
@@ -0,0 +1,556 @@
+"""
+Unit tests for the Redis client.
+"""
+
+import os
+import threading
+import fakeredis
+import pytest
+import redis
+from redis.backoff import FullJitterBackoff
+from redis.retry import Retry
+from unittest.mock import Mock, patch
+from redis.exceptions import ConnectionError, NoScriptError
+
+from .client import (
+    LZ4_FRAME_MAGIC, RedisClient, decode_value, encode_value, get_redis_client, close_redis_client
+)
+
+
+@pytest.fixture
+def client():
+    """RedisClient wired to a mocked connection."""
+    client = RedisClient()
+    client._client = Mock()
+    client._is_connected = True
+    return client
+
+
+@pytest.fixture
+def fake_server(monkeypatch):
+    """In-memory Redis server whose clients honor their pool's decode_responses."""
+    server = fakeredis.FakeServer()
+
+    def make_client(connection_pool=None, **kwargs):
+        decode = connection_pool.connection_kwargs.get("decode_responses", False)
+        return fakeredis.FakeRedis(server=server, decode_responses=decode)
+
+    monkeypatch.setattr("src.agent.redis.client.redis.Redis", make_client)
+    return server
+
+
+class TestConnectionPool:
+    """Test cases for connection pool construction."""
+
+    def test_create_connection_pool(self, client):
+        """Test that the pool targets the configured server."""
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        call_kwargs = mock_pool.call_args.kwargs
+        assert call_kwargs["host"] == "localhost"
+        assert call_kwargs["port"] == 6379
+        assert call_kwargs["db"] == 0
+        assert "password" not in call_kwargs
+
+    def test_create_connection_pool_pool_size(self, client):
+        """Test that the pool size is bounded by configuration."""
+        # Given
+        client._config["pool_size"] = 10
+
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        assert mock_pool.call_args.kwargs["max_connections"] == 10
+
+    def test_create_connection_pool_socket_timeout(self, client):
+        """Test that the reply timeout comes from configuration."""
+        # Given
+        client._config["socket_timeout"] = 2.5
+
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        assert mock_pool.call_args.kwargs["socket_timeout"] == 2.5
+
+    def test_create_connection_pool_keepalive(self, client):
+        """Test that pooled sockets use TCP keepalive."""
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        call_kwargs = mock_pool.call_args.kwargs
+        assert call_kwargs["socket_keepalive"] is True
+        assert isinstance(call_kwargs["socket_keepalive_options"], dict)
+
+    def test_create_connection_pool_client_name(self, client):
+        """Test that pooled connections identify themselves to the server."""
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        assert mock_pool.call_args.kwargs["client_name"] == f"agent-{os.getpid()}"
+
+    def test_create_connection_pool_uses_resp3(self, client):
+        """Test that pooled connections negotiate RESP3."""
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        assert mock_pool.call_args.kwargs["protocol"] == 3
+
+    def test_shared_pool_across_clients(self):
+        """Test that clients with the same configuration share one pool."""
+        # When
+        first = RedisClient()._create_connection_pool()
+        second = RedisClient()._create_connection_pool()
+
+        # Then
+        assert first is second
+
+    def test_hiredis_parser_selected(self, client):
+        """Test that pooled connections parse replies with hiredis."""
+        # Given
+        pytest.importorskip("hiredis")
+        from redis._parsers import _HiredisParser
+
+        # When
+        pool = client._create_connection_pool()
+
+        # Then
+        assert isinstance(pool.make_connection()._parser, _HiredisParser)
+
+    def test_create_connection_pool_unix_socket(self, client):
+        """Test that a configured socket path uses a Unix domain socket connection."""
+        # Given
+        client._config["unix_socket_path"] = "/var/run/redis/redis.sock"
+
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        call_kwargs = mock_pool.call_args.kwargs
+        assert call_kwargs["connection_class"] is redis.UnixDomainSocketConnection
+        assert call_kwargs["path"] == "/var/run/redis/redis.sock"
+        assert "host" not in call_kwargs
+        assert "socket_keepalive" not in call_kwargs
+
+
+class TestRedisOperations:
+    """Test cases for list commands against an in-memory Redis."""
+
+    def test_redis_operations(self, fake_redis):
+        """Test that pushes land in the list in the expected order."""
+        # Given
+        client = RedisClient()
+
+        # When
+        client.lpush("key", "b", "a")
+        client.rpush("key", {"id": 1})
+        length = client.llen("key")
+
+        # Then
+        assert length == 3
+        assert fake_redis.lrange("key", 0, -1) == ["a", "b", '{"id":1}']
+        client.disconnect()
+
+    def test_execute_pipeline_results(self, fake_redis):
+        """Test that pipelined commands return one reply per command."""
+        # Given
+        client = RedisClient()
+        ops = [("rpush", ("key", f"value{i}"), {}) for i in range(3)]
+
+        # When
+        result = client.execute_pipeline(ops + [("llen", ("key",), {})])
+
+        # Then
+        assert result == [1, 2, 3, 3]
+        client.disconnect()
+
+
+class TestEncoding:
+    """Test cases for value encoding."""
+
+    def test_lpush_encodes_dict_with_orjson(self, client):
+        """Test that structured values are sent as compact JSON bytes."""
+        # When
+        client.lpush("key", {"tool": "weather", "enabled": True})
+
+        # Then
+        client._client.lpush.assert_called_once_with("key", b'{"tool":"weather","enabled":true}')
+
+    def test_lpush_compresses_large_payload(self, client):
+        """Test that opted-in values above the threshold are LZ4 compressed."""
+        # Given
+        client._compress_threshold = 512
+        payload = {"tools": [{"name": f"tool{i}", "enabled": True} for i in range(100)]}
+
+        # When
+        client.lpush("key", payload, compress=True)
+
+        # Then
+        sent = client._client.lpush.call_args[0][1]
+        raw = encode_value(payload)
+        assert sent.startswith(LZ4_FRAME_MAGIC)
+        assert len(sent) < len(raw)
+        assert decode_value(sent) == raw
+
+    def test_lpush_small_payload_uncompressed(self, client):
+        """Test that values below the threshold are sent as plain JSON."""
+        # Given
+        client._compress_threshold = 512
+
+        # When
+        client.lpush("key", {"id": 1}, compress=True)
+
+        # Then
+        client._client.lpush.assert_called_once_with("key", b'{"id":1}')
+
+    def test_push_without_opt_in_uncompressed(self, client):
+        """Test that the threshold alone never compresses, keeping shared keys plain JSON."""
+        # Given
+        client._compress_threshold = 512
+        payload = {"tools": [{"name": f"tool{i}", "enabled": True} for i in range(100)]}
+
+        # When
+        client.rpush("tools:updates", payload)
+
+        # Then
+        client._client.rpush.assert_called_once_with("tools:updates", encode_value(payload))
+
+    def test_compressed_round_trip(self, fake_server):
+        """Test that compressed and plain values read back intact through lrange."""
+        # Given
+        client = RedisClient()
+        client._compress_threshold = 512
+        payload = {"tools": [{"name": f"tool{i}", "enabled": True} for i in range(100)]}
+
+        # When
+        client.rpush("key", payload, compress=True)
+        client.rpush("key", {"id": 1})
+        values = client.lrange("key")
+
+        # Then
+        raw_values = fakeredis.FakeRedis(server=fake_server).lrange("key", 0, -1)
+        assert raw_values[0].startswith(LZ4_FRAME_MAGIC)
+        assert values == [encode_value(payload), b'{"id":1}']
+        client.disconnect()
+
+    def test_encode_value_passthrough(self):
+        """Test that bytes pass through and strings are UTF-8 encoded."""
+        assert encode_value(b"raw") == b"raw"
+        assert encode_value("caf\u00e9") == "caf\u00e9".encode()
+        assert encode_value(3) == b"3"
+
+
+class TestPipeline:
+    """Test cases for pipelined command execution."""
+
+    def test_execute_pipeline_single_round_trip(self, client):
+        """Test that a batch of commands is sent with one pipeline execute."""
+        # Given
+        pipe = client._client.pipeline.return_value
+        pipe.execute.return_value = [1, 2, 3]
+        ops = [("rpush", ("key", f"value{i}"), {}) for i in range(3)]
+
+        # When
+        result = client.execute_pipeline(ops)
+
+        # Then
+        assert result == [1, 2, 3]
+        assert pipe.rpush.call_count == 3
+        assert pipe.execute.call_count == 1
+        client._client.pipeline.assert_called_once_with(transaction=False)
+
+    def test_execute_pipeline_returns_command_errors(self, fake_redis):
+        """Test that per-command errors are returned in place when requested."""
+        # Given
+        client = RedisClient()
+        fake_redis.set("string", "value")
+        ops = [("rpush", ("list", "a"), {}), ("rpush", ("string", "b"), {})]
+
+        # When
+        result = client.execute_pipeline(ops, raise_on_error=False)
+
+        # Then
+        assert result[0] == 1
+        assert isinstance(result[1], redis.ResponseError)
+        client.disconnect()
+
+    def test_execute_pipeline_empty_ops(self, client):
+        """Test that an empty batch does not touch Redis."""
+        # When
+        result = client.execute_pipeline([])
+
+        # Then
+        assert result == []
+        client._client.pipeline.assert_not_called()
+
+    def test_pipeline_returns_raw_pipeline(self, client):
+        """Test that pipeline() exposes the underlying pipeline object."""
+        # When
+        pipe = client.pipeline(transaction=True)
+
+        # Then
+        assert pipe is client._client.pipeline.return_value
+        client._client.pipeline.assert_called_once_with(transaction=True)
+
+
+class TestAsyncPipeline:
+    """Test cases for fire-and-forget pipelined writes."""
+
+    def test_async_pipeline_batches(self, client):
+        """Test that several async pushes are flushed in one pipeline execute."""
+        # Given
+        pipe = client._client.pipeline.return_value
+
+        # When
+        for i in range(5):
+            assert client.lpush_async("key", f"value{i}") is True
+        flushed = client.flush(timeout=2.0)
+
+        # Then
+        assert flushed is True
+        assert pipe.lpush.call_count == 5
+        assert pipe.execute.call_count == 1
+        client.disconnect()
+
+    def test_async_pipeline_buffer_full(self, client):
+        """Test that commands are dropped rather than blocking when the buffer is full."""
+        # Given
+        flusher = client._get_flusher()
+        flusher.stop(timeout=1.0)
+
+        # When
+        results = [client.rpush_async("key", i) for i in range(flusher._queue.maxsize + 1)]
+
+        # Then
+        assert results[-1] is False
+        assert all(results[:-1])
+
+    def test_disconnect_abandons_stuck_flusher(self, client, monkeypatch):
+        """Test that disconnect does not wait past its timeout on a flush stuck in retries."""
+        # Given
+        monkeypatch.setattr("src.agent.redis.client.FLUSHER_STOP_TIMEOUT", 0.1)
+        release = threading.Event()
+        client._client.pipeline.return_value.execute.side_effect = lambda **kwargs: release.wait(5.0)
+        client.lpush_async("key", "value")
+        flusher = client._flusher
+
+        # When
+        client.disconnect()
+
+        # Then
+        assert flusher.daemon and flusher.is_alive()
+        assert client._flusher is None
+        release.set()
+        flusher.join(timeout=1.0)
+
+    def test_flush_without_async_writes(self, client):
+        """Test that flush is a no-op when nothing was queued."""
+        assert client.flush(timeout=0.1) is True
+
+
+class TestScripts:
+    """Test cases for server-side Lua scripts."""
+
+    def test_bounded_lpush_atomic(self, client):
+        """Test that a bounded push is a single EVALSHA round trip."""
+        # Given
+        client._scripts["bounded_lpush"] = "sha1"
+        client._client.evalsha.return_value = 3
+
+        # When
+        result = client.bounded_lpush("key", 3, "a", "b")
+
+        # Then
+        assert result == 3
+        client._client.evalsha.assert_called_once_with("sha1", 1, "key", 3, b"a", b"b")
+        client._client.lpush.assert_not_called()
+        client._client.llen.assert_not_called()
+
+    def test_run_script_reloads_flushed_script(self, client):
+        """Test that a NOSCRIPT error reloads the script and retries once."""
+        # Given
+        client._scripts["bounded_lpush"] = "stale"
+        client._client.script_load.return_value = "fresh"
+        client._client.evalsha.side_effect = [NoScriptError("NOSCRIPT"), 1]
+
+        # When
+        result = client.run_script("bounded_lpush", ["key"], [10, "a"])
+
+        # Then
+        assert result == 1
+        assert client._scripts["bounded_lpush"] == "fresh"
+        client._client.evalsha.assert_called_with("fresh", 1, "key", 10, "a")
+
+    def test_register_script_loads_when_connected(self, client):
+        """Test that registering a script on a live connection loads it immediately."""
+        # Given
+        client._client.script_load.return_value = "sha2"
+
+        # When
+        client.register_script("noop", "return 1")
+
+        # Then
+        assert client._scripts["noop"] == "sha2"
+        client._client.script_load.assert_called_once_with("return 1")
+
+
+class TestRetryPolicy:
+    """Test cases for the connection retry policy."""
+
+    def test_connect_retry_logic(self, client):
+        """Test that pooled connections retry with jittered exponential backoff."""
+        # When
+        with patch("src.agent.redis.client.redis.ConnectionPool") as mock_pool:
+            client._create_connection_pool()
+
+        # Then
+        retry = mock_pool.call_args.kwargs["retry"]
+        assert isinstance(retry, Retry)
+        assert retry.get_retries() == 2
+        assert isinstance(retry._backoff, FullJitterBackoff)
+        assert 0 <= retry._backoff.compute(1) <= 0.02
+
+    def test_connect_max_retries_exceeded(self, client):
+        """Test that connect reports failure once the retry policy gives up."""
+        # Given
+        client._is_connected = False
+        mock_redis = Mock()
+        mock_redis.ping.side_effect = ConnectionError("connection refused")
+
+        # When
+        with patch.object(client, "_create_client", return_value=mock_redis):
+            connected = client.connect()
+
+        # Then
+        assert connected is False
+        assert client._is_connected is False
+        mock_redis.ping.assert_called_once()
+
+    def test_execute_with_retry_max_attempts(self, client):
+        """Test that an operation error surfacing past the retry policy returns None."""
+        # Given
+        operation = Mock(side_effect=ConnectionError("connection reset"))
+
+        # When
+        result = client.execute_with_retry("get", operation)
+
+        # Then
+        assert result is None
+        operation.assert_called_once()
+        assert client._is_connected is False
+
+
+class TestHealthCheck:
+    """Test cases for TTL-gated connection validation."""
+
+    def test_is_connected_skips_ping_within_interval(self, client):
+        """Test that a recent success vouches for the connection without a ping."""
+        # Given
+        client._mark_healthy()
+
+        # When
+        connected = client.is_connected()
+
+        # Then
+        assert connected is True
+        client._client.ping.assert_not_called()
+
+    def test_is_connected_pings_after_interval(self, client):
+        """Test that a stale connection is validated with a ping."""
+        # Given
+        client._last_ok = 0.0
+
+        # When
+        connected = client.is_connected()
+
+        # Then
+        assert connected is True
+        client._client.ping.assert_called_once()
+
+    def test_execute_with_retry_no_pre_op_ping(self, client):
+        """Test that operations run without a health check round trip."""
+        # When
+        result = client.execute_with_retry("get", lambda: "value")
+
+        # Then
+        assert result == "value"
+        client._client.ping.assert_not_called()
+
+    def test_execute_with_retry_connection_recovery(self, client):
+        """Test that the call after a connection error reconnects first."""
+        # Given
+        operation = Mock(side_effect=[ConnectionError("connection reset"), "value"])
+
+        # When
+        with patch.object(client, "connect", return_value=True) as mock_connect:
+            first = client.execute_with_retry("get", operation)
+            second = client.execute_with_retry("get", operation)
+
+        # Then
+        assert first is None
+        assert second == "value"
+        mock_connect.assert_called_once()
+
+
+class TestDisconnect:
+    """Test cases for connection teardown."""
+
+    def test_disconnect_with_errors(self, client):
+        """Test that teardown errors are swallowed and all handles are dropped."""
+        # Given
+        client._client.close.side_effect = RuntimeError("close failed")
+        pool = Mock()
+        client._connection_pool = pool
+
+        # When
+        client.disconnect()
+
+        # Then
+        pool.disconnect.assert_not_called()
+        assert client._client is None
+        assert client._connection_pool is None
+        assert client._is_connected is False
+
+
+class TestGlobalFunctions:
+    """Test cases for the module-level client accessors."""
+
+    def test_get_redis_client_singleton(self):
+        """Test that the same client instance is returned on every call."""
+        # Given
+        close_redis_client()
+
+        # When
+        first = get_redis_client()
+        second = get_redis_client()
+
+        # Then
+        assert first is second
+        close_redis_client()
+
+    def test_close_redis_client(self):
+        """Test that closing disconnects and drops the global instance."""
+        # Given
+        first = get_redis_client()
+
+        # When
+        with patch.object(first, "disconnect") as mock_disconnect:
+            close_redis_client()
+
+        # Then
+        mock_disconnect.assert_called_once()
+        assert get_redis_client() is not first
+        close_redis_client()
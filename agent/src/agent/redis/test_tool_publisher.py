@@ -0,0 +1,314 @@
+"""
+Unit tests for the tool publisher service.
+"""
+
+import json
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from unittest.mock import Mock
+
+from redis.exceptions import ResponseError
+
+from . import tool_publisher
+from .tool_publisher import ToolPublisherMetrics, ToolPublisherService, ToolUpdateMessage, get_tool_publisher_service
+
+
+@pytest.fixture
+def service():
+    """ToolPublisherService wired to a mocked Redis client."""
+    service = ToolPublisherService()
+    service._redis_client = Mock()
+    return service
+
+
+def make_message(name: str) -> ToolUpdateMessage:
+    """Build a tool update message adding a single tool."""
+    return ToolUpdateMessage([{"name": name, "mcpServerName": "built-in"}], [])
+
+
+class TestToolUpdateMessage:
+    """Test cases for tool update message serialization."""
+
+    def test_to_json(self):
+        """Test that the message serializes to the wire format."""
+        # Given
+        message = make_message("tool1")
+
+        # When
+        data = json.loads(message.to_json())
+
+        # Then
+        assert data["messageId"] == message.message_id
+        assert data["addedTools"] == [{"name": "tool1", "mcpServerName": "built-in"}]
+        assert data["removedTools"] == []
+        assert data["source"] == "agent"
+
+    def test_to_json_is_cached(self):
+        """Test that the encoding is computed once per message."""
+        # Given
+        message = make_message("tool1")
+
+        # When
+        first = message.to_json_bytes()
+        second = message.to_json_bytes()
+
+        # Then
+        assert first is second
+
+
+class TestToolPublisherMetrics:
+    """Test cases for publish metrics."""
+
+    def test_get_average_latency(self):
+        """Test that the average is computed from the recorded latencies."""
+        # Given
+        metrics = ToolPublisherMetrics()
+
+        # When
+        for latency_ms in (1.0, 2.0, 6.0):
+            metrics.record_publish_success(latency_ms)
+
+        # Then
+        assert metrics.get_average_latency() == 3.0
+        assert sum(metrics.get_latency_buckets()) == 3
+
+    def test_get_percentile_latency(self):
+        """Test that tail percentiles land in the slow bucket."""
+        # Given
+        metrics = ToolPublisherMetrics()
+
+        # When
+        for _ in range(98):
+            metrics.record_publish_success(0.8)
+        for _ in range(2):
+            metrics.record_publish_success(400.0)
+        summary = metrics.get_metrics_summary()
+
+        # Then
+        assert summary["p50_latency_ms"] == 1.0
+        assert summary["p99_latency_ms"] == 500.0
+
+    def test_record_publish_success_from_many_threads(self):
+        """Test that concurrent recording loses no samples."""
+        # Given
+        metrics = ToolPublisherMetrics()
+
+        def record_samples():
+            for i in range(10_000):
+                metrics.record_publish_success(float(i % 100))
+
+        # When
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for _ in range(16):
+                executor.submit(record_samples)
+
+        # Then
+        assert sum(metrics.get_latency_buckets()) == 160_000
+
+    def test_get_percentile_latency_overflow(self):
+        """Test that latencies past the last bound report the largest bound."""
+        # Given
+        metrics = ToolPublisherMetrics()
+
+        # When
+        metrics.record_publish_success(10_000.0)
+
+        # Then
+        assert metrics.get_percentile_latency(99) == 2500.0
+
+
+class TestProcessQueuedMessages:
+    """Test cases for draining the retry queue."""
+
+    def test_process_queued_messages_success(self, service):
+        """Test that all queued messages are published in one pipeline."""
+        # Given
+        messages = [make_message(f"tool{i}") for i in range(3)]
+        service._message_queue.extend(messages)
+        service._redis_client.execute_pipeline.return_value = [1, 2, 3]
+
+        # When
+        service._process_queued_messages()
+
+        # Then
+        service._redis_client.execute_pipeline.assert_called_once()
+        ops = service._redis_client.execute_pipeline.call_args[0][0]
+        assert [op[1] for op in ops] == [(service.REDIS_KEY, m.to_json_bytes()) for m in messages]
+        assert service.get_queue_size() == 0
+
+    def test_process_queued_messages_partial_failure(self, service):
+        """Test that only the messages whose command failed are re-queued."""
+        # Given
+        messages = [make_message(f"tool{i}") for i in range(3)]
+        service._message_queue.extend(messages)
+        service._redis_client.execute_pipeline.return_value = [1, ResponseError("WRONGTYPE"), 2]
+
+        # When
+        service._process_queued_messages()
+
+        # Then
+        assert list(service._message_queue) == [messages[1]]
+
+    def test_process_queued_messages_redis_unavailable(self, service):
+        """Test that the whole batch is re-queued in order when Redis is down."""
+        # Given
+        messages = [make_message(f"tool{i}") for i in range(3)]
+        service._message_queue.extend(messages)
+        service._redis_client.execute_pipeline.return_value = None
+
+        # When
+        service._process_queued_messages()
+
+        # Then
+        assert list(service._message_queue) == messages
+
+
+class TestQueueMessage:
+    """Test cases for the bounded retry queue."""
+
+    def test_queue_message_overflow(self, service):
+        """Test that a full queue drops its oldest message."""
+        # Given
+        service.set_max_queue_size(2)
+        messages = [make_message(f"tool{i}") for i in range(3)]
+
+        # When
+        for message in messages:
+            service._queue_message(message)
+
+        # Then
+        assert list(service._message_queue) == messages[1:]
+
+    def test_set_max_queue_size_keeps_newest(self, service):
+        """Test that shrinking the bound keeps the newest messages."""
+        # Given
+        messages = [make_message(f"tool{i}") for i in range(3)]
+        service._message_queue.extend(messages)
+
+        # When
+        service.set_max_queue_size(1)
+
+        # Then
+        assert list(service._message_queue) == messages[2:]
+
+
+class TestGetQueuedMessagesInfo:
+    """Test cases for queue introspection."""
+
+    def test_get_queued_messages_info(self, service):
+        """Test that queued messages are summarized with their tool counts."""
+        # Given
+        message = ToolUpdateMessage(
+            [{"name": "tool1", "mcpServerName": "built-in"}, {"name": "tool2", "mcpServerName": "built-in"}],
+            [{"name": "tool3", "mcpServerName": "built-in"}]
+        )
+        service._message_queue.append(message)
+
+        # When
+        info = service.get_queued_messages_info()
+
+        # Then
+        assert info == [{
+            "message_id": message.message_id,
+            "timestamp": message.timestamp,
+            "added_tools_count": 2,
+            "removed_tools_count": 1
+        }]
+
+
+class TestPublishBatching:
+    """Test cases for coalescing publishes within a batch window."""
+
+    def test_publish_tool_changes_coalesces_bursts(self, service):
+        """Test that a burst of publishes is sent as one pipeline."""
+        # Given
+        service._batch_window = 0.05
+        service._redis_client.execute_pipeline.side_effect = lambda ops, **kwargs: [1] * len(ops)
+
+        # When
+        results = [
+            service.publish_tool_changes([{"name": f"tool{i}", "mcpServerName": "built-in"}], [])
+            for i in range(5)
+        ]
+        timer = service._flush_timer
+        timer.join(timeout=1.0)
+
+        # Then
+        assert all(results)
+        service._redis_client.execute_pipeline.assert_called_once()
+        assert len(service._redis_client.execute_pipeline.call_args[0][0]) == 5
+        service._redis_client.rpush.assert_not_called()
+        assert service.get_queue_size() == 0
+
+    def test_batched_publishes_record_metrics(self, service):
+        """Test that a flushed batch records success and latency for each message."""
+        # Given
+        service._batch_window = 0.02
+        service._redis_client.execute_pipeline.side_effect = lambda ops, **kwargs: [1] * len(ops)
+
+        # When
+        for i in range(3):
+            service.publish_tool_changes([{"name": f"tool{i}", "mcpServerName": "built-in"}], [])
+        service._flush_timer.join(timeout=1.0)
+
+        # Then
+        summary = service._metrics.get_metrics_summary()
+        assert summary["messages_published"] == 3
+        assert summary["p50_latency_ms"] >= 10
+        assert sum(service._metrics.get_latency_buckets()) == 3
+
+    def test_batched_publish_failure_records_requeue(self, service):
+        """Test that messages re-queued after a failed flush count as failed and queued."""
+        # Given
+        service._batch_window = 0.02
+        service._redis_client.execute_pipeline.return_value = None
+
+        # When
+        for i in range(2):
+            service.publish_tool_changes([{"name": f"tool{i}", "mcpServerName": "built-in"}], [])
+        service._flush_timer.join(timeout=1.0)
+
+        # Then
+        summary = service._metrics.get_metrics_summary()
+        assert summary["messages_published"] == 0
+        assert summary["messages_failed"] == 2
+        assert summary["messages_queued"] == 2
+        assert summary["queue_size_max"] == 2
+        assert service.get_queue_size() == 2
+
+    def test_publish_tool_changes_without_window(self, service):
+        """Test that publishes go out immediately when batching is off."""
+        # Given
+        service._batch_window = 0
+        service._redis_client.rpush.return_value = 1
+
+        # When
+        result = service.publish_tool_changes([{"name": "tool", "mcpServerName": "built-in"}], [])
+
+        # Then
+        assert result is True
+        service._redis_client.rpush.assert_called_once()
+        assert service._flush_timer is None
+
+
+class TestGlobalFunctions:
+    """Test cases for the global publisher service accessor."""
+
+    def test_get_tool_publisher_service_concurrent_first_call(self, monkeypatch):
+        """Test that racing first calls construct a single instance."""
+        # Given
+        monkeypatch.setattr(tool_publisher, "_tool_publisher_service", None)
+        barrier = Barrier(32)
+
+        def get_service():
+            barrier.wait()
+            return get_tool_publisher_service()
+
+        # When
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            results = list(executor.map(lambda _: get_service(), range(32)))
+
+        # Then
+        assert len({id(s) for s in results}) == 1
+        assert results[0] is get_tool_publisher_service()
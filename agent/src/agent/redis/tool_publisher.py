@@ -5,19 +5,26 @@ This module provides functionality to publish tool availability changes
 to Redis with message queuing and retry logic for connection failures.
 """
 
-import json
 import logging
 import time
 import uuid
+from array import array
+from bisect import bisect_left
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 from collections import deque
-from threading import Lock
+from threading import Lock, Timer, get_ident
 
-from src.agent.redis.client import get_redis_client, RedisClient
+from src.agent.monitoring.histogram import bucket_percentile
+from src.agent.redis.client import encode_value, get_redis_client, RedisClient
+from src.config.config_loader import Config
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds (ms) of the publish latency histogram buckets; a final
+# overflow bucket counts anything slower than the last bound.
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
 
 class ToolPublisherMetrics:
     """Metrics tracking for tool publisher operations."""
@@ -28,6 +35,10 @@ class ToolPublisherMetrics:
         self.messages_failed = 0
         self.publish_latency_total = 0.0
         self.publish_latency_count = 0
+        # Per-thread histogram shards: each thread only ever increments its own
+        # array, so recording needs no lock; shards are merged on read
+        self._latency_shards: Dict[int, array] = {}
+        self._shard_lock = Lock()
         self.queue_size_max = 0
         self.redis_connection_failures = 0
         self.redis_connection_recoveries = 0
@@ -39,8 +50,25 @@ class ToolPublisherMetrics:
         self.messages_published += 1
         self.publish_latency_total += latency_ms
         self.publish_latency_count += 1
+        self._latency_shard()[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
         self.last_publish_time = datetime.now(timezone.utc)
         
+    def _latency_shard(self) -> array:
+        """Get the calling thread's histogram shard, creating it on first use."""
+        shard = self._latency_shards.get(get_ident())
+        if shard is None:
+            with self._shard_lock:
+                shard = self._latency_shards.setdefault(
+                    get_ident(), array('Q', [0] * (len(LATENCY_BUCKETS_MS) + 1))
+                )
+        return shard
+    
+    def get_latency_buckets(self) -> List[int]:
+        """Get the publish latency histogram merged across all threads."""
+        with self._shard_lock:
+            shards = list(self._latency_shards.values())
+        return [sum(counts) for counts in zip(*shards)] if shards else [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    
     def record_publish_failure(self):
         """Record a failed publish operation."""
         self.messages_failed += 1
@@ -64,6 +92,19 @@ class ToolPublisherMetrics:
         if self.publish_latency_count == 0:
             return 0.0
         return self.publish_latency_total / self.publish_latency_count
+    
+    def get_percentile_latency(self, percentile: float) -> float:
+        """
+        Get a publish latency percentile from the histogram.
+        
+        Args:
+            percentile: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound in milliseconds of the bucket holding the percentile
+        """
+        buckets = self.get_latency_buckets()
+        return bucket_percentile(buckets, LATENCY_BUCKETS_MS, percentile)
         
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get a summary of all metrics."""
@@ -72,6 +113,9 @@ class ToolPublisherMetrics:
             "messages_queued": self.messages_queued,
             "messages_failed": self.messages_failed,
             "average_latency_ms": self.get_average_latency(),
+            "p50_latency_ms": self.get_percentile_latency(50),
+            "p90_latency_ms": self.get_percentile_latency(90),
+            "p99_latency_ms": self.get_percentile_latency(99),
             "queue_size_max": self.queue_size_max,
             "redis_connection_failures": self.redis_connection_failures,
             "redis_connection_recoveries": self.redis_connection_recoveries,
@@ -83,12 +127,23 @@ class ToolPublisherMetrics:
 class ToolUpdateMessage:
     """Represents a tool update message."""
     
+    __slots__ = (
+        "message_id", "timestamp", "added_tools", "removed_tools", "source",
+        "added_count", "removed_count", "enqueued_at", "_json_bytes"
+    )
+    
     def __init__(self, added_tools: List[Dict[str, str]], removed_tools: List[Dict[str, str]]):
         self.message_id = str(uuid.uuid4())
         self.timestamp = datetime.now(timezone.utc).isoformat()
         self.added_tools = added_tools  # List of {"name": "tool_name", "mcpServerName": "server_name"}
         self.removed_tools = removed_tools  # List of {"name": "tool_name", "mcpServerName": "server_name"}
         self.source = "agent"
+        self.added_count = len(added_tools)
+        self.removed_count = len(removed_tools)
+        # Monotonic time the message entered the queue; batched publish latency
+        # is measured from here
+        self.enqueued_at = time.monotonic()
+        self._json_bytes: Optional[bytes] = None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary."""
@@ -100,9 +155,20 @@ class ToolUpdateMessage:
             "source": self.source
         }
     
+    def to_json_bytes(self) -> bytes:
+        """
+        Convert message to UTF-8 JSON bytes.
+        
+        Messages are not modified after construction, so the encoding is
+        computed once and reused when the message is retried from the queue.
+        """
+        if self._json_bytes is None:
+            self._json_bytes = encode_value(self.to_dict())
+        return self._json_bytes
+    
     def to_json(self) -> str:
         """Convert message to JSON string."""
-        return json.dumps(self.to_dict())
+        return self.to_json_bytes().decode()
 
 
 class ToolPublisherService:
@@ -112,11 +178,14 @@ class ToolPublisherService:
     
     def __init__(self):
         self._redis_client: Optional[RedisClient] = None
-        self._message_queue: deque = deque()
-        self._queue_lock = Lock()
         self._max_queue_size = 100  # Prevent memory issues
+        # Bounded deque: appending to a full queue drops the oldest message
+        self._message_queue: deque = deque(maxlen=self._max_queue_size)
+        self._queue_lock = Lock()
         self._metrics = ToolPublisherMetrics()
         self._redis_connected = False
+        self._batch_window = Config.get_tool_sync_config().get("publish_batch_window_ms", 0) / 1000
+        self._flush_timer: Optional[Timer] = None
         
     def _get_redis_client(self) -> RedisClient:
         """Get Redis client instance."""
@@ -133,7 +202,8 @@ class ToolPublisherService:
             removed_tools: List of tool info dicts with name and mcpServerName
             
         Returns:
-            bool: True if published successfully, False if queued for retry
+            bool: True if published successfully (or accepted into the current
+                batch when a batch window is configured), False if queued for retry
         """
         start_time = time.time()
         
@@ -155,6 +225,10 @@ class ToolPublisherService:
             "timestamp": message.timestamp
         })
         
+        if self._batch_window > 0:
+            self._add_to_batch(message)
+            return True
+        
         # Try to publish immediately
         if self._publish_message(message):
             # Record metrics for successful publish
@@ -186,7 +260,7 @@ class ToolPublisherService:
         
         try:
             redis_client = self._get_redis_client()
-            json_message = message.to_json()
+            json_message = message.to_json_bytes()
             
             # Check Redis connection status and log changes (Requirement 4.3)
             was_connected = self._redis_connected
@@ -246,6 +320,61 @@ class ToolPublisherService:
             self._redis_connected = False
             return False
     
+    def _add_to_batch(self, message: ToolUpdateMessage) -> None:
+        """
+        Add a message to the pending batch, arming a flush for the batch window.
+        
+        Messages published within one window go out in a single pipeline.
+        
+        Args:
+            message: ToolUpdateMessage to publish
+        """
+        with self._queue_lock:
+            self._append_message(message)
+            
+            if self._flush_timer is None:
+                self._flush_timer = Timer(self._batch_window, self._flush_batch)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def _flush_batch(self) -> None:
+        """Publish the pending batch when its window closes."""
+        with self._queue_lock:
+            self._flush_timer = None
+        self._process_queued_messages()
+    
+    def _append_message(self, message: ToolUpdateMessage) -> None:
+        """
+        Append a message to the queue; the caller must hold the queue lock.
+        
+        Args:
+            message: ToolUpdateMessage to append
+        """
+        if len(self._message_queue) == self._message_queue.maxlen:
+            # The append below evicts the oldest message
+            logger.warning("Message queue full, dropping oldest message", extra={
+                "event_type": "message_queue_overflow",
+                "dropped_message_id": self._message_queue[0].message_id,
+                "queue_size": self._max_queue_size,
+                "new_message_id": message.message_id
+            })
+        message.enqueued_at = time.monotonic()
+        self._message_queue.append(message)
+    
+    def set_max_queue_size(self, max_queue_size: int) -> None:
+        """
+        Change the queue bound.
+        
+        A deque's maxlen is fixed, so the queue is rebuilt; if it is already
+        over the new bound, the oldest messages are dropped.
+        
+        Args:
+            max_queue_size: Maximum number of queued messages
+        """
+        with self._queue_lock:
+            self._max_queue_size = max_queue_size
+            self._message_queue = deque(self._message_queue, maxlen=max_queue_size)
+    
     def _queue_message(self, message: ToolUpdateMessage) -> None:
         """
         Queue a message for retry when Redis is unavailable.
@@ -254,18 +383,7 @@ class ToolPublisherService:
             message: ToolUpdateMessage to queue
         """
         with self._queue_lock:
-            # Check queue size limit
-            if len(self._message_queue) >= self._max_queue_size:
-                # Remove oldest message to make room
-                oldest_message = self._message_queue.popleft()
-                logger.warning("Message queue full, dropping oldest message", extra={
-                    "event_type": "message_queue_overflow",
-                    "dropped_message_id": oldest_message.message_id if hasattr(oldest_message, 'message_id') else 'unknown',
-                    "queue_size": self._max_queue_size,
-                    "new_message_id": message.message_id
-                })
-            
-            self._message_queue.append(message)
+            self._append_message(message)
             queue_size = len(self._message_queue)
             
             # Record metrics and log queuing event
@@ -279,38 +397,59 @@ class ToolPublisherService:
             })
     
     def _process_queued_messages(self) -> None:
-        """Process all queued messages."""
-        if not self._message_queue:
-            return
+        """Publish all queued messages in a single pipelined round trip."""
+        with self._queue_lock:
+            if not self._message_queue:
+                return
+            batch = list(self._message_queue)
+            self._message_queue.clear()
         
-        logger.info("Processing %d queued messages", len(self._message_queue))
+        logger.info("Processing %d queued messages", len(batch))
         
-        with self._queue_lock:
-            # Process messages in FIFO order
-            processed_count = 0
-            failed_messages = deque()
-            
-            while self._message_queue:
-                message = self._message_queue.popleft()
-                
-                if self._publish_message(message):
-                    processed_count += 1
-                    logger.debug("Successfully published queued message %s", message.message_id)
-                else:
-                    # If publishing fails, stop processing and re-queue remaining messages
-                    failed_messages.append(message)
-                    failed_messages.extend(self._message_queue)
-                    self._message_queue.clear()
-                    break
-            
-            # Re-queue any failed messages
-            self._message_queue.extend(failed_messages)
-            
-            if processed_count > 0:
-                logger.info("Successfully processed %d queued messages", processed_count)
-            
-            if self._message_queue:
-                logger.warning("%d messages remain in queue for retry", len(self._message_queue))
+        ops = [("rpush", (self.REDIS_KEY, message.to_json_bytes()), {}) for message in batch]
+        try:
+            results = self._get_redis_client().execute_pipeline(ops, raise_on_error=False)
+        except Exception as e:
+            logger.error("Error publishing queued messages to Redis", extra={
+                "event_type": "message_publish_error",
+                "error_type": type(e).__name__,
+                "error_message": str(e),
+                "batch_size": len(batch)
+            }, exc_info=True)
+            results = None
+        
+        if results is None:
+            failed_messages = batch
+        else:
+            # A per-command failure comes back as the exception in that message's slot
+            failed_messages = [
+                message for message, result in zip(batch, results)
+                if isinstance(result, Exception)
+            ]
+        
+        processed_count = len(batch) - len(failed_messages)
+        if processed_count > 0:
+            logger.info("Successfully processed %d queued messages", processed_count)
+            # Latency runs from enqueue, so batched publishes include their wait
+            # in the batch window
+            now = time.monotonic()
+            failed_ids = {id(message) for message in failed_messages}
+            for message in batch:
+                if id(message) not in failed_ids:
+                    self._metrics.record_publish_success((now - message.enqueued_at) * 1000)
+        
+        if failed_messages:
+            # Re-queue failures ahead of anything queued meanwhile to keep FIFO order;
+            # rebuilding the bounded deque drops the oldest messages if it overflows
+            with self._queue_lock:
+                self._message_queue = deque(
+                    [*failed_messages, *self._message_queue], maxlen=self._max_queue_size
+                )
+                remaining = len(self._message_queue)
+                for _ in failed_messages:
+                    self._metrics.record_publish_failure()
+                    self._metrics.record_message_queued(remaining)
+            logger.warning("%d messages remain in queue for retry", remaining)
     
     def retry_queued_messages(self) -> int:
         """
@@ -367,8 +506,8 @@ class ToolPublisherService:
                 {
                     "message_id": msg.message_id,
                     "timestamp": msg.timestamp,
-                    "added_tools_count": len(msg.added_tools),
-                    "removed_tools_count": len(msg.removed_tools)
+                    "added_tools_count": msg.added_count,
+                    "removed_tools_count": msg.removed_count
                 }
                 for msg in self._message_queue
             ]
@@ -407,11 +546,17 @@ class ToolPublisherService:
 
 # Global tool publisher service instance
 _tool_publisher_service: Optional[ToolPublisherService] = None
+_singleton_lock = Lock()
 
 
 def get_tool_publisher_service() -> ToolPublisherService:
     """Get the global tool publisher service instance."""
     global _tool_publisher_service
-    if _tool_publisher_service is None:
-        _tool_publisher_service = ToolPublisherService()
-    return _tool_publisher_service
\ No newline at end of file
+    service = _tool_publisher_service
+    if service is None:
+        # Double-checked so concurrent first calls build exactly one instance
+        with _singleton_lock:
+            service = _tool_publisher_service
+            if service is None:
+                service = _tool_publisher_service = ToolPublisherService()
+    return service
@@ -5,7 +5,6 @@ These tools are bound directly to the LangGraph agent instead of using MCP.
 
 import os
 import sys
-import inspect
 import importlib
 import glob
 from pathlib import Path
@@ -65,21 +64,15 @@ def _load_tools():
             else:
                 module = importlib.import_module(module_name)
             
-            # Find all BaseTool instances in the module
-            module_tools = []
-            current_module = module
-            
-            for name, obj in inspect.getmembers(current_module):
-                if isinstance(obj, BaseTool):
-                    logger.info(f"Added {name} to tools from {module_name}")
-                    module_tools.append(obj)
-            
-            # Also check for __all_tools__ list in the module
+            # Prefer the module's explicit __all_tools__ list; only scan the
+            # module namespace for BaseTool instances when it has none
             if hasattr(module, '__all_tools__'):
-                for tool in module.__all_tools__:
-                    if isinstance(tool, BaseTool) and tool not in module_tools:
-                        logger.info(f"Added tool {tool.name} from __all_tools__ in {module_name}")
-                        module_tools.append(tool)
+                module_tools = [tool for tool in module.__all_tools__ if isinstance(tool, BaseTool)]
+            else:
+                module_tools = [obj for obj in vars(module).values() if isinstance(obj, BaseTool)]
+            
+            for tool in module_tools:
+                logger.info(f"Added tool {tool.name} from {module_name}")
             
             tools.extend(module_tools)
             logger.info("Loaded %d tools from %s", len(module_tools), module_name)
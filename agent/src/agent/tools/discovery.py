@@ -130,63 +130,86 @@ class ToolDiscoveryService:
                 if self._mcp_client is None:
                     return []
             
-            # Get tools from MCP client
-            mcp_tools = await self._mcp_client.get_tools()
-            
-            # Validate tool naming and assign server information
-            servers_config = mcp_config.get("servers", {})
-            validated_tools = []
-            
-            for tool in mcp_tools:
-                # Find which server this tool belongs to based on naming convention
-                server_name = None
-                tool_name = tool.name
-                
-                # Check each configured server to see if tool name starts with server name
-                for configured_server_name in servers_config.keys():
-                    expected_prefix = f"{configured_server_name}-"
-                    if tool_name.startswith(expected_prefix):
-                        server_name = configured_server_name
-                        break
-                
-                if server_name is None:
-                    # Tool doesn't follow naming convention
-                    server_names = list(servers_config.keys())
-                    expected_prefixes = [f"{name}-" for name in server_names]
-                    
-                    error_msg = (
-                        f"MCP tool '{tool_name}' does not follow naming convention. "
-                        f"Expected tool name to start with one of: {expected_prefixes}, "
-                        f"but actual name is '{tool_name}'"
-                    )
-                    
-                    logger.error("Tool naming validation failed", extra={
-                        "event_type": "tool_naming_validation_error",
-                        "tool_name": tool_name,
-                        "expected_prefixes": expected_prefixes,
-                        "configured_servers": server_names
-                    })
-                    
-                    raise ValueError(error_msg)
-                
-                # Mark tool with its server name
-                tool._mcp_server_name = server_name
-                validated_tools.append(tool)
-                
-                logger.debug("Validated tool '%s' belongs to server '%s'", tool_name, server_name)
-            
-            logger.debug("Successfully validated and retrieved %d tools from MCP servers", len(validated_tools))
-            
-            # Reset connection failure flag on success
-            self._mcp_connection_failed = False
-            
-            return validated_tools
+            # Query all servers concurrently so one slow or failing server
+            # neither delays nor hides the tools of the others
+            server_names = self.list_servers()
+            results = await asyncio.gather(
+                *(self.discover_tools_for(server_name) for server_name in server_names),
+                return_exceptions=True
+            )
             
         except Exception as e:
             logger.warning("MCP server connection failed, falling back to local tools only: %s", str(e))
             self._mcp_connection_failed = True
             self._mcp_client = None
             return []
+        
+        validated_tools = []
+        failed_servers = []
+        for server_name, result in zip(server_names, results):
+            if isinstance(result, BaseException):
+                logger.warning("MCP tool discovery failed for server '%s': %s", server_name, str(result))
+                failed_servers.append(server_name)
+            else:
+                validated_tools.extend(result)
+        
+        if failed_servers and len(failed_servers) == len(server_names):
+            logger.warning("MCP server connection failed, falling back to local tools only")
+            self._mcp_connection_failed = True
+            self._mcp_client = None
+            return []
+        
+        logger.debug("Successfully validated and retrieved %d tools from MCP servers", len(validated_tools))
+        
+        # Reset connection failure flag on success
+        self._mcp_connection_failed = False
+        
+        return validated_tools
+    
+    def list_servers(self) -> List[str]:
+        """
+        Get the names of the configured MCP servers.
+        
+        Returns:
+            List of MCP server names
+        """
+        return list(Config.get_mcp_config().get("servers", {}).keys())
+    
+    async def discover_tools_for(self, server_name: str) -> List[BaseTool]:
+        """
+        Discover the tools of a single MCP server.
+        
+        Args:
+            server_name: Name of a configured MCP server
+            
+        Returns:
+            List of the server's BaseTool instances with server info attached
+            
+        Raises:
+            ValueError: If a tool name does not start with '<server_name>-'
+        """
+        tools = await self._mcp_client.get_tools(server_name=server_name)
+        expected_prefix = f"{server_name}-"
+        
+        for tool in tools:
+            if not tool.name.startswith(expected_prefix):
+                logger.error("Tool naming validation failed", extra={
+                    "event_type": "tool_naming_validation_error",
+                    "tool_name": tool.name,
+                    "expected_prefixes": [expected_prefix],
+                    "configured_servers": [server_name]
+                })
+                raise ValueError(
+                    f"MCP tool '{tool.name}' does not follow naming convention. "
+                    f"Expected tool name to start with '{expected_prefix}', "
+                    f"but actual name is '{tool.name}'"
+                )
+            
+            # Mark tool with its server name
+            tool._mcp_server_name = server_name
+            logger.debug("Validated tool '%s' belongs to server '%s'", tool.name, server_name)
+        
+        return tools
     
     async def _create_mcp_client(self) -> Optional[MultiServerMCPClient]:
         """
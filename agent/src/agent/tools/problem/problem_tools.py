@@ -1,16 +1,11 @@
 from typing import List
 from langchain_core.tools import tool
 from src.agent.models import Choice
-from langchain_core.tools import BaseTool
-import sys
-import inspect
 from src.config import Config
 from src.agent.utils.http_client import http_get, http_post
 from typing_extensions import Annotated
 from langgraph.prebuilt import InjectedState
 
-__all_tools__ = []
-
 
 @tool("list_problem_categories_tool")
 async def list_problem_categories_tool(
@@ -145,8 +140,9 @@ async def create_problem_category_tool(
         return f"Error creating problem: {str(e)}"
 
 
-current_module = sys.modules[__name__]
-for name, obj in inspect.getmembers(current_module):
-    if isinstance(obj, BaseTool):
-        print(f"Added {name} to tools", flush=True)
-        __all_tools__.append(obj)
\ No newline at end of file
+__all_tools__ = [
+    list_problem_categories_tool,
+    list_problems_by_category_tool,
+    create_problem_tool,
+    create_problem_category_tool,
+]
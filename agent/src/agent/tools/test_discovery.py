@@ -0,0 +1,100 @@
+"""
+Unit tests for the tool discovery service.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import Config
+from .discovery import ToolDiscoveryService
+
+
+SERVERS = ["alpha", "beta", "gamma"]
+
+
+class FakeMCPClient:
+    """MCP client stub answering per-server tool listings after a delay."""
+
+    def __init__(self, delay: float = 0.0, failing=()):
+        self.delay = delay
+        self.failing = set(failing)
+        self.calls = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def get_tools(self, server_name=None):
+        self.calls.append(server_name)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        if server_name in self.failing:
+            raise ConnectionError(f"{server_name} unreachable")
+        return [SimpleNamespace(name=f"{server_name}-tool")]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """ToolDiscoveryService configured with three MCP servers."""
+    monkeypatch.setattr(Config, "get_mcp_config", classmethod(
+        lambda cls: {"enabled": True, "servers": {name: {} for name in SERVERS}}
+    ))
+    return ToolDiscoveryService()
+
+
+class TestDiscoverMCPTools:
+    """Test cases for per-server MCP tool discovery."""
+
+    async def test_servers_are_queried_concurrently(self, service):
+        """Test that every server's listing is in flight at the same time."""
+        # Given
+        service._mcp_client = FakeMCPClient(delay=0.01)
+
+        # When
+        tools = await service._discover_mcp_tools_with_fallback()
+
+        # Then
+        assert sorted(service._mcp_client.calls) == SERVERS
+        assert [tool._mcp_server_name for tool in tools] == SERVERS
+        assert service._mcp_client.peak_in_flight == len(SERVERS)
+
+    async def test_failing_server_does_not_hide_others(self, service):
+        """Test that one unreachable server only drops its own tools."""
+        # Given
+        service._mcp_client = FakeMCPClient(failing={"beta"})
+
+        # When
+        tools = await service._discover_mcp_tools_with_fallback()
+
+        # Then
+        assert [tool.name for tool in tools] == ["alpha-tool", "gamma-tool"]
+        assert service._mcp_connection_failed is False
+
+    async def test_all_servers_failing_falls_back(self, service):
+        """Test that losing every server marks the MCP connection as failed."""
+        # Given
+        service._mcp_client = FakeMCPClient(failing=SERVERS)
+
+        # When
+        tools = await service._discover_mcp_tools_with_fallback()
+
+        # Then
+        assert tools == []
+        assert service._mcp_connection_failed is True
+        assert service._mcp_client is None
+
+    async def test_discover_tools_for_rejects_misnamed_tool(self, service):
+        """Test that a tool without its server's prefix is rejected."""
+        # Given
+        service._mcp_client = FakeMCPClient()
+        service._mcp_client.get_tools = lambda server_name=None: asyncio.sleep(
+            0, result=[SimpleNamespace(name="other-tool")]
+        )
+
+        # When / Then
+        with pytest.raises(ValueError):
+            await service.discover_tools_for("alpha")
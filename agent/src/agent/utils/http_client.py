@@ -5,18 +5,44 @@ import logging
 import asyncio
 from typing import Optional
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared client so backend calls reuse pooled keep-alive connections
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=32)
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared async HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
 async def http_get(url: str, params: dict, timeout: int = 10, retries: int = 3) -> str:
     logger.info(f"Making GET request to: {url} with params: {params}")
     
     for attempt in range(retries):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, params=params)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-                return response.text
+            response = await get_client().get(url, params=params, timeout=timeout)
+            logger.info(f"Response status: {response.status_code}")
+            response.raise_for_status()
+            return response.text
         except httpx.ConnectError as e:
             logger.warning(f"Connection error to {url} (attempt {attempt + 1}/{retries}): {str(e)}")
             if attempt == retries - 1:
@@ -37,14 +63,20 @@ async def http_get(url: str, params: dict, timeout: int = 10, retries: int = 3)
 
 async def http_post(url: str, json_body: dict, timeout: int = 10, retries: int = 3) -> str:
     logger.info(f"Making POST request to: {url} with body: {json_body}")
-    
+    # Encoded once up front so retries resend the same bytes; non-str dict
+    # keys are allowed as the stdlib json encoder did
+    try:
+        content = orjson.dumps(json_body, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError as e:
+        logger.error(f"Unexpected error calling {url}: {str(e)}")
+        raise Exception(f"Unexpected error calling backend: {str(e)}")
+
     for attempt in range(retries):
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(url, json=json_body)
-                logger.info(f"Response status: {response.status_code}")
-                response.raise_for_status()
-                return response.text
+            response = await get_client().post(url, content=content, headers=_JSON_HEADERS, timeout=timeout)
+            logger.info(f"Response status: {response.status_code}")
+            response.raise_for_status()
+            return response.text
         except httpx.ConnectError as e:
             logger.warning(f"Connection error to {url} (attempt {attempt + 1}/{retries}): {str(e)}")
             if attempt == retries - 1:
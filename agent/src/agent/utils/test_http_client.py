@@ -0,0 +1,84 @@
+"""
+Unit tests for the shared HTTP client helpers.
+"""
+
+import httpx
+import orjson
+import pytest
+
+from src.agent.utils import http_client
+
+
+@pytest.fixture
+def requests_seen(monkeypatch):
+    """Install a shared client whose transport records every request."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, text="ok")
+
+    monkeypatch.setattr(http_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return seen
+
+
+class TestSharedClient:
+    """Test cases for reusing one AsyncClient across calls."""
+
+    async def test_calls_reuse_shared_client(self, requests_seen):
+        """Test that GET and POST go through the same client."""
+        # Given
+        client = http_client.get_client()
+
+        # When
+        get_text = await http_client.http_get("http://backend/list", {"channelId": 1})
+        post_text = await http_client.http_post("http://backend/create", {"name": "x"})
+
+        # Then
+        assert (get_text, post_text) == ("ok", "ok")
+        assert [r.method for r in requests_seen] == ["GET", "POST"]
+        assert http_client.get_client() is client
+        await http_client.close_client()
+
+    async def test_post_sends_orjson_body(self, requests_seen):
+        """Test that POST bodies are sent as JSON with a JSON content type."""
+        # Given
+        body = {"problemCategoryId": 7, "choices": [{"text": "é", "isCorrect": True}]}
+
+        # When
+        await http_client.http_post("http://backend/create", body)
+
+        # Then
+        request = requests_seen[0]
+        assert request.headers["content-type"] == "application/json"
+        assert orjson.loads(request.content) == body
+        await http_client.close_client()
+
+    async def test_post_accepts_non_str_keys(self, requests_seen):
+        """Test that integer dict keys are encoded as strings like stdlib json."""
+        # When
+        await http_client.http_post("http://backend/create", {"answers": {1: "a"}})
+
+        # Then
+        assert orjson.loads(requests_seen[0].content) == {"answers": {"1": "a"}}
+        await http_client.close_client()
+
+    async def test_post_unserializable_body_is_wrapped(self, requests_seen):
+        """Test that an unencodable body fails with the usual wrapped error."""
+        # When / Then
+        with pytest.raises(Exception, match="Unexpected error calling backend"):
+            await http_client.http_post("http://backend/create", {"when": object()})
+
+        assert requests_seen == []
+
+    async def test_get_client_recreates_after_close(self, requests_seen):
+        """Test that a closed client is replaced on next use."""
+        # Given
+        client = http_client.get_client()
+
+        # When
+        await http_client.close_client()
+
+        # Then
+        assert http_client.get_client() is not client
+        await http_client.close_client()
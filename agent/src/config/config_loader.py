@@ -13,6 +13,7 @@ class Config:
     """Configuration management for Agent"""
     
     _config_cache: Optional[Dict[str, Any]] = None
+    _redis_config_cache: Optional[Dict[str, Any]] = None
     _config_file = Path("config.yaml")
     
     # Environment Variables
@@ -37,15 +38,26 @@ class Config:
     REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_DB = int(os.getenv("REDIS_DB", "0"))
     REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
+    REDIS_UNIX_SOCKET_PATH = os.getenv("REDIS_UNIX_SOCKET_PATH")
+    REDIS_PROTOCOL = int(os.getenv("REDIS_PROTOCOL", "3"))
     REDIS_RETRY_MAX_ATTEMPTS = int(os.getenv("REDIS_RETRY_MAX_ATTEMPTS", "3"))
     REDIS_RETRY_BASE_DELAY = float(os.getenv("REDIS_RETRY_BASE_DELAY", "1.0"))
     REDIS_RETRY_MAX_DELAY = float(os.getenv("REDIS_RETRY_MAX_DELAY", "30.0"))
+    REDIS_POOL_SIZE = int(os.getenv("REDIS_POOL_SIZE", "50"))
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "5"))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5"))
+    REDIS_SOCKET_KEEPALIVE = os.getenv("REDIS_SOCKET_KEEPALIVE", "true").lower() == "true"
+    REDIS_HEALTH_CHECK_INTERVAL = float(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+    REDIS_COMPRESSION_THRESHOLD = int(os.getenv("REDIS_COMPRESSION_THRESHOLD", "0"))
+    REDIS_PIPELINE_BATCH_SIZE = int(os.getenv("REDIS_PIPELINE_BATCH_SIZE", "50"))
+    REDIS_PIPELINE_FLUSH_INTERVAL_MS = int(os.getenv("REDIS_PIPELINE_FLUSH_INTERVAL_MS", "50"))
     
     # Tool Sync HTTP Server Configuration
     TOOL_SYNC_HTTP_ENABLED = os.getenv("TOOL_SYNC_HTTP_ENABLED", "true").lower() == "true"
     TOOL_SYNC_HTTP_HOST = os.getenv("TOOL_SYNC_HTTP_HOST", "0.0.0.0")
     TOOL_SYNC_HTTP_PORT = int(os.getenv("TOOL_SYNC_HTTP_PORT", "5001"))
     TOOL_SYNC_HTTP_TIMEOUT = int(os.getenv("TOOL_SYNC_HTTP_TIMEOUT", "10"))
+    TOOL_PUBLISH_BATCH_WINDOW_MS = int(os.getenv("TOOL_PUBLISH_BATCH_WINDOW_MS", "0"))
     
     # Tool Discovery Configuration
     TOOL_DISCOVERY_TIMEOUT = int(os.getenv("TOOL_DISCOVERY_TIMEOUT", "10"))
@@ -64,6 +76,12 @@ class Config:
                 cls._config_cache = {}
         return cls._config_cache
     
+    @classmethod
+    def reload(cls) -> None:
+        """Drop cached configuration so the next lookup re-reads it"""
+        cls._config_cache = None
+        cls._redis_config_cache = None
+    
     @classmethod
     def get_openai_config(cls) -> Dict[str, Any]:
         """Get OpenAI configuration"""
@@ -146,21 +164,37 @@ class Config:
     @classmethod
     def get_redis_config(cls) -> Dict[str, Any]:
         """Get Redis configuration with environment variables taking precedence over YAML"""
+        if cls._redis_config_cache is not None:
+            return cls._redis_config_cache
+        
         config = cls.load_yaml_config()
         yaml_redis = config.get("redis", {})
         
         # Environment variables take precedence over YAML config
-        return {
+        cls._redis_config_cache = {
             "host": cls.REDIS_HOST,
             "port": cls.REDIS_PORT,
             "db": cls.REDIS_DB,
             "password": cls.REDIS_PASSWORD,
+            "unix_socket_path": cls.REDIS_UNIX_SOCKET_PATH,
+            "protocol": cls.REDIS_PROTOCOL,
+            "pool_size": cls.REDIS_POOL_SIZE,
+            "connect_timeout": cls.REDIS_CONNECT_TIMEOUT,
+            "socket_timeout": cls.REDIS_SOCKET_TIMEOUT,
+            "socket_keepalive": cls.REDIS_SOCKET_KEEPALIVE,
+            "health_check_interval": cls.REDIS_HEALTH_CHECK_INTERVAL,
+            "compression_threshold": cls.REDIS_COMPRESSION_THRESHOLD,
             "retry": {
                 "max_attempts": cls.REDIS_RETRY_MAX_ATTEMPTS,
                 "base_delay": cls.REDIS_RETRY_BASE_DELAY,
                 "max_delay": cls.REDIS_RETRY_MAX_DELAY
+            },
+            "pipeline": {
+                "batch_size": cls.REDIS_PIPELINE_BATCH_SIZE,
+                "flush_interval_ms": cls.REDIS_PIPELINE_FLUSH_INTERVAL_MS
             }
         }
+        return cls._redis_config_cache
     
     @classmethod
     def get_tool_sync_config(cls) -> Dict[str, Any]:
@@ -172,6 +206,7 @@ class Config:
         return {
             "enabled": yaml_tool_sync.get("enabled", True),
             "discovery_on_startup": yaml_tool_sync.get("discovery_on_startup", True),
+            "publish_batch_window_ms": cls.TOOL_PUBLISH_BATCH_WINDOW_MS,
             "http_server": {
                 "enabled": cls.TOOL_SYNC_HTTP_ENABLED,
                 "host": cls.TOOL_SYNC_HTTP_HOST,
@@ -1,9 +1,17 @@
 import os
+import queue
 import yaml
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Prefer the libyaml-backed loader (bundled with most PyYAML wheels)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,8 +20,15 @@ load_dotenv()
 class Config:
     """Configuration management for MCP Server"""
     
-    _config_cache: Optional[Dict[str, Any]] = None
+    # (mtime, size, parsed config) of the last config.yaml read
+    _config_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None
+    # Derived config sections, dropped whenever config.yaml is re-parsed
+    _section_cache: Dict[str, Any] = {}
     _config_file = Path("config.yaml")
+    # Background thread writing queued log records to the real handlers
+    _log_listener: Optional[QueueListener] = None
+    # basicConfig kwargs built by the first get_logging_config call
+    _logging_config: Optional[Dict[str, Any]] = None
     
     # Environment Variables (sensitive data)
     DEBUG = os.getenv("DEBUG", "false").lower() == "true"
@@ -32,14 +47,24 @@ class Config:
     
     @classmethod
     def load_yaml_config(cls) -> Dict[str, Any]:
-        """Load configuration from YAML file"""
-        if cls._config_cache is None:
-            try:
-                with open(cls._config_file, 'r') as f:
-                    cls._config_cache = yaml.safe_load(f)
-            except FileNotFoundError:
-                cls._config_cache = {}
-        return cls._config_cache
+        """Load configuration from YAML file, re-parsing only when it changes"""
+        try:
+            st = cls._config_file.stat()
+        except FileNotFoundError:
+            if cls._config_cache is not None:
+                cls._config_cache = None
+                cls._section_cache = {}
+            return {}
+
+        cached = cls._config_cache
+        if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            return cached[2]
+
+        with open(cls._config_file, 'r') as f:
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        cls._config_cache = (st.st_mtime, st.st_size, data)
+        cls._section_cache = {}
+        return data
     
     @classmethod
     def get_backend_url(cls) -> str:
@@ -53,43 +78,65 @@ class Config:
 
     @classmethod
     def get_logging_config(cls) -> Dict[str, Any]:
-        """Get logging configuration with validated types"""
+        """Get logging configuration with validated types, built once per process"""
+        if cls._logging_config is not None:
+            return cls._logging_config
+
         config = cls.load_yaml_config().get("logging", {})
 
         level_str = config.get("level", "INFO").upper()
         level = getattr(logging, level_str, logging.INFO)
         
-        # Ensure logs directory exists
-        os.makedirs("logs", exist_ok=True)
-        
         handlers = [logging.StreamHandler()]
         
         # Add file handler if specified in config
         if "file" in config.get("handlers", []):
             file_path = config.get("file_path", "logs/mcp-server.log")
+            # Ensure the log file's directory exists
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
             handlers.append(logging.FileHandler(file_path))
 
-        return {
+        # Tool calls only enqueue records; console and file writes happen on the
+        # listener thread so they never block the event loop. The queue handler
+        # gets the configured format and hands fully formatted lines to these
+        log_queue = queue.SimpleQueue()
+        cls._log_listener = QueueListener(log_queue, *handlers)
+        cls._log_listener.start()
+
+        cls._logging_config = {
             "level": level,
             "format": config.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"),
-            "handlers": handlers
+            "handlers": [QueueHandler(log_queue)]
         }
+        return cls._logging_config
+
+    @classmethod
+    def stop_logging(cls) -> None:
+        """Flush queued log records and stop the logging listener thread"""
+        if cls._log_listener is not None:
+            cls._log_listener.stop()
+            cls._log_listener = None
+        cls._logging_config = None
     
     @classmethod
     def get_http_config(cls) -> Dict[str, Any]:
         """Get HTTP client configuration"""
         config = cls.load_yaml_config()
-        return config.get("http", {
-            "user_agent": "mcp-server/1.0.0",
-            "retry_attempts": 3,
-            "retry_delay": 1
-        })
+        if "http" not in cls._section_cache:
+            cls._section_cache["http"] = config.get("http", {
+                "user_agent": "mcp-server/1.0.0",
+                "retry_attempts": 3,
+                "retry_delay": 1
+            })
+        return cls._section_cache["http"]
     
     @classmethod
     def get_tools_config(cls) -> Dict[str, Any]:
         """Get tools configuration"""
         config = cls.load_yaml_config()
-        return config.get("tools", {
-            "weather": {"enabled": True},
-            "quip_backend": {"enabled": True}
-        })
+        if "tools" not in cls._section_cache:
+            cls._section_cache["tools"] = config.get("tools", {
+                "weather": {"enabled": True},
+                "quip_backend": {"enabled": True}
+            })
+        return cls._section_cache["tools"]
@@ -2,19 +2,23 @@
 Main entry point for the MCP Server
 """
 
+import asyncio
 import logging
 from src.mcp_server.app import mcp
 from src.mcp_server.config import Config
+from src.mcp_server.tools import aclose_clients
 
 # Configure logging
 logging.basicConfig(**Config.get_logging_config())
 logger = logging.getLogger(__name__)
 
-if __name__ == "__main__":
+
+async def main():
     logger.info("Starting MCP Server...")
     try:
-        # Use streamable-http transport and set the path prefix to match AI backend expectations
-        mcp.run(
+        # Use streamable-http transport and set the path prefix to match AI backend expectations.
+        # Run on our own event loop so shared HTTP clients can be closed on it at shutdown
+        await mcp.run_async(
             transport="streamable-http",
             host=Config.HOST, 
             port=Config.PORT,
@@ -24,3 +28,10 @@ if __name__ == "__main__":
     except Exception as e:
         logger.error(f"Error starting MCP Server: {str(e)}")
         raise
+    finally:
+        await aclose_clients()
+        Config.stop_logging()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,5 +1,22 @@
 """
 Tools package with static imports
+
+A tool module registers itself with FastMCP on import, so tools disabled in
+config.yaml are never imported and never advertised to clients.
 """
 
-from .weather import *
+from src.mcp_server.config import Config
+
+_tools_config = Config.get_tools_config()
+
+_weather_enabled = _tools_config.get("weather", {}).get("enabled", True)
+
+if _weather_enabled:
+    from .weather import *
+
+
+async def aclose_clients() -> None:
+    """Close the shared HTTP clients of the enabled tools."""
+    if _weather_enabled:
+        from .weather import aclose_client
+        await aclose_client()
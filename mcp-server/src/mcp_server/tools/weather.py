@@ -1,11 +1,102 @@
 import httpx
+import importlib.util
 import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 from fastmcp import Context
 from src.mcp_server.app import mcp
+from src.mcp_server.config import Config
 
 logger = logging.getLogger(__name__)
 
+_GEO_URL = "https://nominatim.openstreetmap.org/search"
+_WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Shared client so repeat lookups reuse pooled keep-alive connections to
+# Nominatim and Open-Meteo instead of handshaking on every call
+_client: Optional[httpx.AsyncClient] = None
+
+# Both upstream APIs are HTTPS, so HTTP/2 is negotiated via ALPN when the
+# optional h2 package (httpx[http2]) is installed; otherwise HTTP/1.1 keep-alive
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Entries kept per cache before the least recently used one is evicted
+_CACHE_SIZE = 1024
+
+# Coordinates are effectively static per city, so repeat lookups skip the
+# Nominatim round-trip for tools.weather.geocode_cache_duration seconds
+_geocode_cache: "OrderedDict[str, Tuple[float, Tuple[str, str]]]" = OrderedDict()
+
+# Current weather per coordinates, reused for tools.weather.cache_duration seconds
+_weather_cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared weather HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=5,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            headers={'User-Agent': 'weather-app'},
+            http2=_HTTP2
+        )
+    return _client
+
+
+async def aclose_client() -> None:
+    """Close the shared weather HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+async def _geocode(client: httpx.AsyncClient, city_key: str) -> Optional[Tuple[str, str]]:
+    """Look up (lat, lon) for a normalized city name, caching found cities."""
+    now = time.monotonic()
+    cache_duration = Config.get_tools_config().get("weather", {}).get("geocode_cache_duration", 3600)
+    cached = _geocode_cache.get(city_key)
+    if cached is not None and now - cached[0] < cache_duration:
+        _geocode_cache.move_to_end(city_key)
+        return cached[1]
+
+    geo_response = await client.get(_GEO_URL, params={"q": city_key, "format": "json", "limit": 1})
+    geo_data = geo_response.json()
+    if not geo_data:
+        return None
+
+    coordinates = (geo_data[0]["lat"], geo_data[0]["lon"])
+    _geocode_cache[city_key] = (now, coordinates)
+    _geocode_cache.move_to_end(city_key)
+    if len(_geocode_cache) > _CACHE_SIZE:
+        _geocode_cache.popitem(last=False)
+    return coordinates
+
+
+async def _current_weather(client: httpx.AsyncClient, lat: str, lon: str) -> Dict[str, Any]:
+    """Fetch the forecast response for coordinates, reusing a fresh cached one."""
+    key = (lat, lon)
+    now = time.monotonic()
+    cache_duration = Config.get_tools_config().get("weather", {}).get("cache_duration", 300)
+    cached = _weather_cache.get(key)
+    if cached is not None and now - cached[0] < cache_duration:
+        return cached[1]
+
+    weather_response = await client.get(
+        _WEATHER_URL, params={"latitude": lat, "longitude": lon, "current_weather": "true"}
+    )
+    weather_data = weather_response.json()
+
+    if "current_weather" in weather_data:
+        _weather_cache[key] = (now, weather_data)
+        _weather_cache.move_to_end(key)
+        if len(_weather_cache) > _CACHE_SIZE:
+            _weather_cache.popitem(last=False)
+    return weather_data
+
 
 @mcp.tool(name="QuipMCPServer-weather_tool")
 async def weather_tool(city: str, context: Context) -> str:
@@ -14,34 +105,27 @@ async def weather_tool(city: str, context: Context) -> str:
     status_update_message = "Looking up weather...\n"
     await context.report_progress(0, None, status_update_message)
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            geo_url = f"https://nominatim.openstreetmap.org/search?q={city}&format=json&limit=1"
-            geo_response = await client.get(geo_url, headers={'User-Agent': 'weather-app'})
-            geo_data = geo_response.json()
-            if not geo_data:
-                logger.warning("Could not find coordinates for city: %s", city)
-                return f"Could not find coordinates for {city}."
-
-            lat = geo_data[0]["lat"]
-            lon = geo_data[0]["lon"]
-
-            weather_url = f"https://api.open-meteo.com/v1/forecast?latitude={lat}&longitude={lon}&current_weather=true"
-            weather_response = await client.get(weather_url)
-            weather_data = weather_response.json()
-
-            if "current_weather" in weather_data:
-                current = weather_data["current_weather"]
-                result = (
-                    f"Current weather in {city}: "
-                    f"{current['temperature']}°C, Windspeed {current['windspeed']} km/h, "
-                    f"Weather code {current['weathercode']}."
-                )
-                logger.info("Weather data retrieved successfully for %s", city)
-                return result
-            else:
-                logger.error("No current weather data in response for %s", city)
-                return f"Could not fetch weather for {city}."
+        client = _get_client()
+        coordinates = await _geocode(client, city.strip().lower())
+        if coordinates is None:
+            logger.warning("Could not find coordinates for city: %s", city)
+            return f"Could not find coordinates for {city}."
+
+        lat, lon = coordinates
+        weather_data = await _current_weather(client, lat, lon)
+
+        if "current_weather" in weather_data:
+            current = weather_data["current_weather"]
+            result = (
+                f"Current weather in {city}: "
+                f"{current['temperature']}°C, Windspeed {current['windspeed']} km/h, "
+                f"Weather code {current['weathercode']}."
+            )
+            logger.info("Weather data retrieved successfully for %s", city)
+            return result
+        else:
+            logger.error("No current weather data in response for %s", city)
+            return f"Could not fetch weather for {city}."
     except Exception as e:
         logger.exception("Error fetching weather data for %s: %s", city, str(e))
         return f"Error fetching weather data: {str(e)}"
-